@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import datetime as dt
+from functools import lru_cache
 from typing import Any, Dict
 
+import coincurve
 import requests
-from eth_account import Account
-from eth_account.messages import encode_defunct, encode_typed_data
-from eth_utils import is_address
+from eth_account.messages import SignableMessage, encode_defunct, encode_typed_data
+from eth_utils import is_address, keccak, to_checksum_address
 from fastapi import HTTPException
 
 from .config import (
@@ -16,50 +17,103 @@ from .config import (
     CLOB_AUTH_MESSAGE,
     CLOB_HOST,
 )
+from .utils import parse_json
+
+_CLOB_SESSION = requests.Session()
+_CLOB_CREATE_API_KEY_URL = f"{CLOB_HOST}/auth/api-key"
+_CLOB_DERIVE_API_KEY_URL = f"{CLOB_HOST}/auth/derive-api-key"
+
+# Static EIP-712 schema for the ClobAuth message. encode_typed_data copies the
+# types mapping before touching it, so sharing one instance across calls is safe.
+_CLOB_AUTH_TYPES: Dict[str, Any] = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+    ],
+    "ClobAuth": [
+        {"name": "address", "type": "address"},
+        {"name": "timestamp", "type": "string"},
+        {"name": "nonce", "type": "uint256"},
+        {"name": "message", "type": "string"},
+    ],
+}
+_CLOB_AUTH_PRIMARY = "ClobAuth"
+
+_SIWE_TEMPLATE = (
+    "OpiPoliX Web Experiment\n"
+    "Sign this message to authenticate.\n\n"
+    "Address: {address}\n"
+    "Chain ID: {chain_id}\n"
+    "Nonce: {nonce}\n"
+    "Issued At: {issued_at}"
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_addr_cached(address: str) -> bool:
+    return is_address(address)
 
 
 def validate_eth_address(address: str) -> str:
-    if not address or not is_address(address):
+    if not address or not _is_addr_cached(address):
         raise HTTPException(status_code=400, detail="Invalid EVM address")
     return address
 
 
+def _utc_now_iso() -> str:
+    now = dt.datetime.now(dt.timezone.utc).replace(microsecond=0, tzinfo=None)
+    return now.isoformat() + "Z"
+
+
 def build_siwe_message(address: str, nonce: str, chain_id: int = CHAIN_ID) -> str:
-    now = dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
-    return (
-        "OpiPoliX Web Experiment\n"
-        "Sign this message to authenticate.\n\n"
-        f"Address: {address}\n"
-        f"Chain ID: {chain_id}\n"
-        f"Nonce: {nonce}\n"
-        f"Issued At: {now}"
+    return _SIWE_TEMPLATE.format(
+        address=address,
+        chain_id=chain_id,
+        nonce=nonce,
+        issued_at=_utc_now_iso(),
+    )
+
+
+def _signature_bytes(signature: str) -> bytes:
+    text = str(signature or "").strip()
+    if text[:2] in ("0x", "0X"):
+        text = text[2:]
+    sig = bytes.fromhex(text)
+    if len(sig) != 65:
+        raise ValueError(f"signature must be 65 bytes, got {len(sig)}")
+    return sig
+
+
+def _hash_signable(signable: SignableMessage) -> bytes:
+    return keccak(b"\x19" + signable.version + signable.header + signable.body)
+
+
+def recover_hash_signer(msg_hash: bytes, signature: str) -> str:
+    sig = _signature_bytes(signature)
+    v = sig[64]
+    if v >= 27:
+        v -= 27
+    if v not in (0, 1):
+        raise ValueError(f"invalid signature recovery id: {sig[64]}")
+    public_key = coincurve.PublicKey.from_signature_and_message(
+        sig[:64] + bytes([v]), msg_hash, hasher=None
     )
+    return to_checksum_address(keccak(public_key.format(compressed=False)[1:])[-20:])
 
 
 def recover_personal_signer(message: str, signature: str) -> str:
     try:
         signable = encode_defunct(text=message)
-        return Account.recover_message(signable, signature=signature)
+        return recover_hash_signer(_hash_signable(signable), signature)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=f"Invalid signature: {exc}") from exc
 
 
 def clob_auth_typed_data(address: str, timestamp: int, nonce: int, chain_id: int) -> Dict[str, Any]:
     return {
-        "types": {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-            ],
-            "ClobAuth": [
-                {"name": "address", "type": "address"},
-                {"name": "timestamp", "type": "string"},
-                {"name": "nonce", "type": "uint256"},
-                {"name": "message", "type": "string"},
-            ],
-        },
-        "primaryType": "ClobAuth",
+        "types": _CLOB_AUTH_TYPES,
+        "primaryType": _CLOB_AUTH_PRIMARY,
         "domain": {
             "name": CLOB_AUTH_DOMAIN_NAME,
             "version": CLOB_AUTH_DOMAIN_VERSION,
@@ -84,7 +138,7 @@ def recover_clob_auth_signer(
     typed = clob_auth_typed_data(address, timestamp, nonce, chain_id)
     try:
         signable = encode_typed_data(full_message=typed)
-        recovered = Account.recover_message(signable, signature=signature)
+        recovered = recover_hash_signer(_hash_signable(signable), signature)
     except Exception as exc:
         raise HTTPException(
             status_code=400, detail=f"Invalid CLOB auth signature: {exc}"
@@ -109,14 +163,11 @@ def derive_clob_api_creds(
         "POLY_NONCE": str(nonce),
     }
 
-    create_url = f"{CLOB_HOST}/auth/api-key"
-    derive_url = f"{CLOB_HOST}/auth/derive-api-key"
-
-    create_resp = requests.post(create_url, headers=headers, timeout=10)
+    create_resp = _CLOB_SESSION.post(_CLOB_CREATE_API_KEY_URL, headers=headers, timeout=10)
     if create_resp.ok:
-        payload = create_resp.json()
+        payload = parse_json(create_resp)
     else:
-        derive_resp = requests.get(derive_url, headers=headers, timeout=10)
+        derive_resp = _CLOB_SESSION.get(_CLOB_DERIVE_API_KEY_URL, headers=headers, timeout=10)
         if not derive_resp.ok:
             raise HTTPException(
                 status_code=400,
@@ -125,7 +176,7 @@ def derive_clob_api_creds(
                     f"create={create_resp.status_code}, derive={derive_resp.status_code}"
                 ),
             )
-        payload = derive_resp.json()
+        payload = parse_json(derive_resp)
 
     api_key = payload.get("apiKey")
     api_secret = payload.get("secret")
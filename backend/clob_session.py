@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from eth_account import Account
@@ -16,26 +17,77 @@ from py_clob_client.clob_types import (
 
 from .polymarket.clob_trading import build_builder_config, normalize_order_id
 
-from .config import CHAIN_ID, CLOB_HOST
+from .config import CHAIN_ID, CLOB_HOST, MAX_SAFE_JSON_INT
 
 _DUMMY_PRIVATE_KEY = "0x" + "1" * 64
-_MAX_SAFE_JSON_INT = 9_007_199_254_740_991
 
+_ADDRESS_FIELDS = ("maker", "signer", "taker")
+_UINT_STRING_FIELDS = (
+    "tokenId",
+    "makerAmount",
+    "takerAmount",
+    "expiration",
+    "nonce",
+    "feeRateBps",
+)
 
-def _to_int(value: Any, field: str) -> int:
+_SIDE_MAP: Dict[Any, str] = {
+    "BUY": "BUY",
+    "buy": "BUY",
+    "Buy": "BUY",
+    "SELL": "SELL",
+    "sell": "SELL",
+    "Sell": "SELL",
+    0: "BUY",
+    1: "SELL",
+    "0": "BUY",
+    "1": "SELL",
+}
+
+
+def _to_int(value: Any, field: str, max_value: Optional[int] = None) -> int:
+    if max_value is not None:
+        return _to_bounded_int(value, field, max_value)
+    # Exact type checks first: bool is a distinct type, so it falls through and is rejected.
+    t = type(value)
+    if t is int:
+        return value
+    if t is str:
+        text = value.strip()
+        return int(text, 16) if text[:2] in ("0x", "0X") else int(text)
     if isinstance(value, bool):
         raise ValueError(f"{field} must be integer-like, got bool")
     if isinstance(value, int):
         return value
     if isinstance(value, str):
         text = value.strip()
-        if text.startswith("0x") or text.startswith("0X"):
-            return int(text, 16)
-        return int(text)
+        return int(text, 16) if text[:2] in ("0x", "0X") else int(text)
     return int(value)
 
 
+def _to_bounded_int(value: Any, field: str, max_value: int) -> int:
+    out_of_range = f"{field} must be in [0, {max_value}] for CLOB JSON payload compatibility"
+    if isinstance(value, str):
+        # Reject oversized strings by digit count before int() builds a bignum from them.
+        text = value.strip()
+        if text[:2] in ("0x", "0X"):
+            digits, limit = text[2:], len(f"{max_value:x}")
+        else:
+            digits, limit = text.lstrip("+-"), len(str(max_value))
+        if len(digits.lstrip("0")) > limit:
+            raise ValueError(out_of_range)
+    n = _to_int(value, field)
+    if n < 0 or n > max_value:
+        raise ValueError(out_of_range)
+    return n
+
+
 def _normalize_side(value: Any) -> str:
+    # bool hashes like 0/1, so keep it off the fast path and let _to_int reject it.
+    if type(value) is not bool:
+        side = _SIDE_MAP.get(value)
+        if side is not None:
+            return side
     if isinstance(value, str):
         text = value.strip().upper()
         if text in {"BUY", "SELL"}:
@@ -48,39 +100,35 @@ def _normalize_side(value: Any) -> str:
     raise ValueError(f"side must be BUY/SELL or 0/1, got {value!r}")
 
 
+@lru_cache(maxsize=4096)
+def _checksum_cached(addr: str) -> str:
+    return to_checksum_address(addr) if is_address(addr) else ""
+
+
 def _normalize_addr(value: Any, field: str) -> str:
     text = str(value or "").strip()
-    if not is_address(text):
+    checksummed = _checksum_cached(text)
+    if not checksummed:
         raise ValueError(f"{field} is not a valid address: {value!r}")
-    return to_checksum_address(text)
+    return checksummed
 
 
 def _normalize_signed_order_payload(signed_order: Dict[str, Any]) -> Dict[str, Any]:
-    signature = str(signed_order.get("signature") or "").strip()
+    get = signed_order.get
+    signature = str(get("signature") or "").strip()
     if not signature:
         raise ValueError("signature is required")
 
-    salt = _to_int(signed_order.get("salt"), "salt")
-    if salt < 0 or salt > _MAX_SAFE_JSON_INT:
-        raise ValueError(
-            f"salt must be in [0, {_MAX_SAFE_JSON_INT}] for CLOB JSON payload compatibility"
-        )
+    salt = _to_int(get("salt"), "salt", max_value=MAX_SAFE_JSON_INT)
 
-    normalized = {
-        "salt": salt,
-        "maker": _normalize_addr(signed_order.get("maker"), "maker"),
-        "signer": _normalize_addr(signed_order.get("signer"), "signer"),
-        "taker": _normalize_addr(signed_order.get("taker"), "taker"),
-        "tokenId": str(_to_int(signed_order.get("tokenId"), "tokenId")),
-        "makerAmount": str(_to_int(signed_order.get("makerAmount"), "makerAmount")),
-        "takerAmount": str(_to_int(signed_order.get("takerAmount"), "takerAmount")),
-        "expiration": str(_to_int(signed_order.get("expiration"), "expiration")),
-        "nonce": str(_to_int(signed_order.get("nonce"), "nonce")),
-        "feeRateBps": str(_to_int(signed_order.get("feeRateBps"), "feeRateBps")),
-        "side": _normalize_side(signed_order.get("side")),
-        "signatureType": int(_to_int(signed_order.get("signatureType"), "signatureType")),
-        "signature": signature,
-    }
+    normalized: Dict[str, Any] = {"salt": salt}
+    for name in _ADDRESS_FIELDS:
+        normalized[name] = _normalize_addr(get(name), name)
+    for name in _UINT_STRING_FIELDS:
+        normalized[name] = str(_to_int(get(name), name))
+    normalized["side"] = _normalize_side(get("side"))
+    normalized["signatureType"] = int(_to_int(get("signatureType"), "signatureType"))
+    normalized["signature"] = signature
     return normalized
 
 
@@ -102,9 +150,13 @@ class SessionAddressSigner:
 @dataclass
 class SignedOrderPayload:
     order_data: Dict[str, Any]
+    _normalized: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
 
     def dict(self):
-        return _normalize_signed_order_payload(self.order_data)
+        # py_clob_client may serialize the order more than once (body + builder headers).
+        if self._normalized is None:
+            self._normalized = _normalize_signed_order_payload(self.order_data)
+        return self._normalized
 
 
 class Level2SessionClobClient:
@@ -116,10 +168,10 @@ class Level2SessionClobClient:
         signature_type: int = 0,
         private_key: Optional[str] = None,
     ):
-        if not is_address(eoa_address):
+        if not _checksum_cached(str(eoa_address or "")):
             raise ValueError("Invalid eoa_address")
 
-        if funder_address and not is_address(funder_address):
+        if funder_address and not _checksum_cached(funder_address):
             raise ValueError("Invalid funder_address")
 
         key_to_use = _DUMMY_PRIVATE_KEY
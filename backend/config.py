@@ -8,6 +8,7 @@ CHAIN_ID = int(os.getenv("WEB_EXPERIMENT_CHAIN_ID", "137"))
 SESSION_COOKIE_NAME = "opipolix_webexp_session"
 SESSION_TTL_SECONDS = int(os.getenv("WEB_EXPERIMENT_SESSION_TTL_SECONDS", "43200"))
 NONCE_TTL_SECONDS = int(os.getenv("WEB_EXPERIMENT_NONCE_TTL_SECONDS", "300"))
+MAX_IDEMPOTENCY_KEYS = int(os.getenv("WEB_EXPERIMENT_MAX_IDEMPOTENCY_KEYS", "100000"))
 
 AUTH_RATE_LIMIT_WINDOW_SECONDS = int(
     os.getenv("WEB_EXPERIMENT_AUTH_RATE_WINDOW_SECONDS", "60")
@@ -16,13 +17,27 @@ AUTH_RATE_LIMIT_MAX_REQUESTS = int(
     os.getenv("WEB_EXPERIMENT_AUTH_RATE_MAX_REQUESTS", "30")
 )
 
+# Comma-separated origins allowed to call the API cross-origin with cookies. The bundled UI is
+# served same-origin and needs none.
+CORS_ALLOW_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv("WEB_EXPERIMENT_CORS_ORIGINS", "").split(",")
+    if origin.strip()
+)
+
+UI_CACHE_MAX_AGE_SECONDS = int(os.getenv("WEB_EXPERIMENT_UI_CACHE_MAX_AGE_SECONDS", "3600"))
+
 TP_POLL_SECONDS = float(os.getenv("WEB_EXPERIMENT_TP_POLL_SECONDS", "2"))
 TP_MAX_MINUTES = int(os.getenv("WEB_EXPERIMENT_TP_MAX_MINUTES", "30"))
+TP_MAX_ACTIVE_ARMS = int(os.getenv("WEB_EXPERIMENT_TP_MAX_ACTIVE_ARMS", "1000"))
 
 CLOB_AUTH_DOMAIN_NAME = "ClobAuthDomain"
 CLOB_AUTH_DOMAIN_VERSION = "1"
 CLOB_AUTH_MESSAGE = "This message attests that I control the given wallet"
 
+# Largest integer that survives a JSON round trip through doubles (2**53 - 1).
+MAX_SAFE_JSON_INT = 9_007_199_254_740_991
+
 DEFAULT_EXCHANGE_ADDRESS = "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E"
 
 _FORCE_SIGNATURE_TYPE_RAW = os.getenv("WEB_EXPERIMENT_FORCE_SIGNATURE_TYPE", "").strip()
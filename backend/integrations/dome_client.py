@@ -2,9 +2,15 @@ from __future__ import annotations
 
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dome-search")
 
 
 class DomeClient:
@@ -14,19 +20,22 @@ class DomeClient:
             raise ValueError("DOME_API_KEY is required")
 
         self.base_url = (base_url or os.getenv("DOME_BASE_URL") or "https://api.domeapi.io/v1").rstrip("/")
+        self._markets_url = f"{self.base_url}/polymarket/markets"
+        self._wallet_url = f"{self.base_url}/polymarket/wallet"
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
 
-    @staticmethod
-    def _safe_get(obj: Any, key: str, default: Any = None) -> Any:
-        if isinstance(obj, dict):
-            return obj.get(key, default)
-        try:
-            return getattr(obj, key)
-        except Exception:
-            return default
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     @staticmethod
     def _to_float(value: Any, default: float = 0.0) -> float:
@@ -54,12 +63,7 @@ class DomeClient:
 
     def _search_raw(self, query: str, limit: int) -> List[Dict[str, Any]]:
         params = {"search": query, "status": "open", "limit": int(limit)}
-        response = requests.get(
-            f"{self.base_url}/polymarket/markets",
-            headers=self.headers,
-            params=params,
-            timeout=10,
-        )
+        response = self._session.get(self._markets_url, params=params, timeout=10)
         response.raise_for_status()
         payload = response.json()
         if isinstance(payload, dict):
@@ -68,48 +72,53 @@ class DomeClient:
                 return [m for m in markets if isinstance(m, dict)]
         return []
 
-    def _transform_market(self, market: Dict[str, Any]) -> Dict[str, Any]:
-        g = self._safe_get
+    def _transform_market(self, market: Dict[str, Any], now: float) -> Dict[str, Any]:
+        get = market.get
+        to_float = self._to_float
 
-        market_id = str(
-            g(market, "market_id")
-            or g(market, "id")
-            or g(market, "market_slug")
-            or ""
-        )
-        title = str(g(market, "title") or g(market, "question") or "Untitled")
-        question = str(g(market, "question") or title)
+        market_slug = get("market_slug")
+        market_id = str(get("market_id") or get("id") or market_slug or "")
+        raw_title = get("title")
+        raw_question = get("question")
+        title = str(raw_title or raw_question or "Untitled")
+        question = str(raw_question or title)
 
-        volume_total = self._to_float(g(market, "volume_total"), 0.0)
-        volume_week = self._to_float(g(market, "volume_1_week"), 0.0)
-        volume_month = self._to_float(g(market, "volume_1_month"), 0.0)
+        volume_total = to_float(get("volume_total"), 0.0)
+        volume_week = to_float(get("volume_1_week"), 0.0)
+        volume_month = to_float(get("volume_1_month"), 0.0)
         volume_24h = volume_week / 7.0 if volume_week > 0 else volume_month / 30.0
 
-        liquidity = self._to_float(g(market, "liquidity"), 0.0)
+        liquidity = to_float(get("liquidity"), 0.0)
         if liquidity <= 0:
             liquidity = volume_total * 0.3
 
-        side_a = g(market, "side_a") or {}
-        side_b = g(market, "side_b") or {}
-        side_a_id = g(side_a, "id")
-        side_b_id = g(side_b, "id")
-        side_a_label = str(g(side_a, "label") or "")
-        side_b_label = str(g(side_b, "label") or "")
-
-        yes_price = self._to_float(
-            g(market, "current_yes_price"),
-            self._to_float(g(market, "yes_price"), 0.5),
+        side_a = get("side_a")
+        side_b = get("side_b")
+        if not isinstance(side_a, dict):
+            side_a = {}
+        if not isinstance(side_b, dict):
+            side_b = {}
+        side_a_label = str(side_a.get("label") or "")
+        side_b_label = str(side_b.get("label") or "")
+
+        yes_price = to_float(
+            get("current_yes_price"),
+            to_float(get("yes_price"), 0.5),
         )
-        no_price = self._to_float(
-            g(market, "current_no_price"),
-            self._to_float(g(market, "no_price"), max(0.0, 1.0 - yes_price)),
+        no_price = to_float(
+            get("current_no_price"),
+            to_float(get("no_price"), max(0.0, 1.0 - yes_price)),
         )
 
         opportunity_score = self._opportunity_score(liquidity, yes_price, volume_24h)
 
+        # Markets without a (parseable) end_time are treated as open.
+        end_time = to_float(get("end_time"), 0.0)
+        active = end_time <= 0 or end_time > now
+
         return {
             "market_id": market_id,
-            "market_slug": str(g(market, "market_slug") or ""),
+            "market_slug": str(market_slug or ""),
             "title": title,
             "question": question,
             "liquidity": liquidity,
@@ -118,21 +127,21 @@ class DomeClient:
             "volume_24h": volume_24h,
             "volume_total": volume_total,
             "opportunity_score": opportunity_score,
-            "active": bool((g(market, "end_time") or time.time() + 1) > time.time()),
-            "tags": g(market, "tags") or [],
-            "yes_label": g(market, "yes_label") or g(market, "yes_outcome"),
-            "no_label": g(market, "no_label") or g(market, "no_outcome"),
+            "active": active,
+            "tags": get("tags") or [],
+            "yes_label": get("yes_label") or get("yes_outcome"),
+            "no_label": get("no_label") or get("no_outcome"),
             "dome_raw": {
-                "condition_id": g(market, "condition_id"),
-                "side_a_id": side_a_id,
-                "side_b_id": side_b_id,
+                "condition_id": get("condition_id"),
+                "side_a_id": side_a.get("id"),
+                "side_b_id": side_b.get("id"),
                 "side_a_label": side_a_label,
                 "side_b_label": side_b_label,
             },
-            "clob_token_yes": g(market, "clob_token_yes"),
-            "clob_token_no": g(market, "clob_token_no"),
-            "yes_token_id": g(market, "yes_token_id"),
-            "no_token_id": g(market, "no_token_id"),
+            "clob_token_yes": get("clob_token_yes"),
+            "clob_token_no": get("clob_token_no"),
+            "yes_token_id": get("yes_token_id"),
+            "no_token_id": get("no_token_id"),
         }
 
     def get_wallet(
@@ -144,8 +153,7 @@ class DomeClient:
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
     ) -> Optional[Dict[str, Any]]:
-        keys = [bool(eoa), bool(proxy), bool(handle)]
-        if sum(keys) != 1:
+        if (bool(eoa) + bool(proxy) + bool(handle)) != 1:
             raise ValueError("Provide exactly one of eoa, proxy, or handle")
 
         params: Dict[str, Any] = {}
@@ -163,12 +171,7 @@ class DomeClient:
             if end_time is not None:
                 params["end_time"] = int(end_time)
 
-        response = requests.get(
-            f"{self.base_url}/polymarket/wallet",
-            headers=self.headers,
-            params=params,
-            timeout=10,
-        )
+        response = self._session.get(self._wallet_url, params=params, timeout=10)
         response.raise_for_status()
         payload = response.json()
         return payload if isinstance(payload, dict) else None
@@ -180,9 +183,11 @@ class DomeClient:
                 f"{project_name} token",
                 f"{project_name} launch",
             ]
+            # Fire all fallback terms at once, but keep the original priority order.
+            futures = [_SEARCH_POOL.submit(self._search_raw, term, limit) for term in terms]
             markets: List[Dict[str, Any]] = []
-            for term in terms:
-                rows = self._search_raw(term, limit)
+            for fut in futures:
+                rows = fut.result()
                 if rows:
                     markets = rows
                     break
@@ -190,8 +195,9 @@ class DomeClient:
             if not markets:
                 return self._empty_response()
 
-            transformed = [self._transform_market(m) for m in markets]
-            transformed.sort(key=lambda x: float(x.get("opportunity_score") or 0), reverse=True)
+            now = time.time()
+            transformed = [self._transform_market(m, now) for m in markets]
+            transformed.sort(key=itemgetter("opportunity_score"), reverse=True)
 
             return {
                 "markets_found": transformed,
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import mimetypes
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from eth_account import Account
-from eth_account.messages import encode_typed_data
+from eth_abi import encode as abi_encode
+from eth_utils import keccak
 from py_clob_client.client import ClobClient
 from py_clob_client.config import get_contract_config
 from py_clob_client.clob_types import AssetType
 from py_clob_client.exceptions import PolyApiException
 from fastapi import Cookie, Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from pydantic import ValidationError
 
 from . import auth
 from .clob_session import Level2SessionClobClient
@@ -21,7 +29,9 @@ from .config import (
     AUTH_RATE_LIMIT_WINDOW_SECONDS,
     CHAIN_ID,
     CLOB_HOST,
+    CORS_ALLOW_ORIGINS,
     SESSION_COOKIE_NAME,
+    UI_CACHE_MAX_AGE_SECONDS,
     WEB_EXPERIMENT_ENABLED,
 )
 from .models import (
@@ -29,6 +39,7 @@ from .models import (
     LimitOrderRequest,
     NonceRequest,
     NonceResponse,
+    ParsedSignedOrder,
     SearchResult,
     TpArmRequest,
     TpStatusResponse,
@@ -36,36 +47,57 @@ from .models import (
 )
 from .resolver import TradingContextResolver
 from .store import InMemoryStore
-from .tp_engine import TpEngine
+from .tp_engine import TpCapacityExceeded, TpEngine
+from .utils import address_bytes
 
 if not WEB_EXPERIMENT_ENABLED:
     raise RuntimeError("WEB_EXPERIMENT is disabled. Set WEB_EXPERIMENT=1 to run this app.")
 
+logger = logging.getLogger(__name__)
+
 store = InMemoryStore()
 resolver = TradingContextResolver()
 tp_engine = TpEngine(store)
 public_clob = ClobClient(host=CLOB_HOST, chain_id=CHAIN_ID)
+# Only used by verify_auth; sized to the default anyio threadpool limit so that every
+# login worker can have its trading-context lookup in flight at once.
+resolve_pool = ThreadPoolExecutor(max_workers=40, thread_name_prefix="webexp-resolve")
 
-app = FastAPI(title="OpiPoliX Web Experiment", version="0.1.0")
+REGULAR_EXCHANGE = get_contract_config(CHAIN_ID, False).exchange
+NEG_RISK_EXCHANGE = get_contract_config(CHAIN_ID, True).exchange
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    store.start_sweeper()
+    try:
+        yield
+    finally:
+        store.stop_sweeper()
 
 
-def _client_ip(request: Request) -> str:
-    fwd = request.headers.get("x-forwarded-for")
-    if fwd:
-        return fwd.split(",")[0].strip()
-    return request.client.host if request.client else "unknown"
+app = FastAPI(
+    title="OpiPoliX Web Experiment",
+    version="0.1.0",
+    lifespan=_lifespan,
+)
+
+if CORS_ALLOW_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ALLOW_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 
 def _enforce_auth_rate_limit(request: Request, bucket: str) -> None:
-    ip = _client_ip(request)
+    fwd = request.headers.get("x-forwarded-for")
+    if fwd:
+        ip = fwd.partition(",")[0].strip()
+    else:
+        client = request.client
+        ip = client.host if client else "unknown"
     key = f"{bucket}:{ip}"
     allowed = store.allow_rate_limit(
         key=key,
@@ -76,28 +108,10 @@ def _enforce_auth_rate_limit(request: Request, bucket: str) -> None:
         raise HTTPException(status_code=429, detail="Too many auth attempts")
 
 
-def _to_lower(value: Any) -> str:
-    return str(value or "").lower()
-
-
-def _normalize_side(raw: Any) -> str:
-    if isinstance(raw, str):
-        text = raw.upper().strip()
-        if text in {"BUY", "SELL"}:
-            return text
-    try:
-        n = int(raw)
-        return "BUY" if n == 0 else "SELL"
-    except Exception:
-        pass
-    raise HTTPException(status_code=400, detail="Invalid order side")
-
-
-def _calc_order_size_tokens(signed_order: Dict[str, Any]) -> float:
-    side = _normalize_side(signed_order.get("side"))
-    maker_amount = float(signed_order.get("makerAmount") or 0)
-    taker_amount = float(signed_order.get("takerAmount") or 0)
-    if side == "BUY":
+def _calc_order_size_tokens(signed_order: ParsedSignedOrder) -> float:
+    maker_amount = float(signed_order.makerAmount)
+    taker_amount = float(signed_order.takerAmount)
+    if signed_order.side == "BUY":
         return taker_amount / 1e6
     return maker_amount / 1e6
 
@@ -112,7 +126,7 @@ def _safe_float(value: Any) -> Optional[float]:
         return None
 
 
-def _invalid_payload_min_size_hint(token_id: str, signed_order: Dict[str, Any]) -> Optional[str]:
+def _invalid_payload_min_size_hint(token_id: str, signed_order: ParsedSignedOrder) -> Optional[str]:
     try:
         book = public_clob.get_order_book(token_id)
         min_raw = getattr(book, "min_order_size", None)
@@ -120,9 +134,8 @@ def _invalid_payload_min_size_hint(token_id: str, signed_order: Dict[str, Any])
         if not min_size or min_size <= 0:
             return None
 
-        side = _normalize_side(signed_order.get("side"))
-        maker_amount = _safe_float(signed_order.get("makerAmount")) or 0.0
-        taker_amount = _safe_float(signed_order.get("takerAmount")) or 0.0
+        side = signed_order.side
+        maker_amount = float(signed_order.makerAmount)
 
         # In BUY orders makerAmount is USDC, takerAmount is shares. In SELL it's the opposite.
         if side == "BUY":
@@ -144,100 +157,101 @@ def _invalid_payload_min_size_hint(token_id: str, signed_order: Dict[str, Any])
     return None
 
 
-def _to_int_or_raise(value: Any, field: str) -> int:
-    if isinstance(value, bool):
-        raise HTTPException(status_code=400, detail=f"{field} must be integer-like")
-    try:
-        if isinstance(value, int):
-            return value
-        if isinstance(value, str):
-            text = value.strip()
-            if text.startswith("0x") or text.startswith("0X"):
-                return int(text, 16)
-            return int(text)
-        return int(value)
-    except Exception as exc:
-        raise HTTPException(status_code=400, detail=f"{field} is invalid: {value!r}") from exc
-
-
-def _order_side_to_uint8(value: Any) -> int:
-    if isinstance(value, str):
-        text = value.strip().upper()
-        if text == "BUY":
-            return 0
-        if text == "SELL":
-            return 1
-    n = _to_int_or_raise(value, "side")
-    if n in {0, 1}:
-        return n
-    raise HTTPException(status_code=400, detail=f"side must be BUY/SELL or 0/1, got {value!r}")
-
-
-def _recover_order_signer_for_exchange(
-    signed_order: Dict[str, Any],
-    exchange_address: str,
-) -> str:
-    typed = {
-        "types": {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"},
-            ],
-            "Order": [
-                {"name": "salt", "type": "uint256"},
-                {"name": "maker", "type": "address"},
-                {"name": "signer", "type": "address"},
-                {"name": "taker", "type": "address"},
-                {"name": "tokenId", "type": "uint256"},
-                {"name": "makerAmount", "type": "uint256"},
-                {"name": "takerAmount", "type": "uint256"},
-                {"name": "expiration", "type": "uint256"},
-                {"name": "nonce", "type": "uint256"},
-                {"name": "feeRateBps", "type": "uint256"},
-                {"name": "side", "type": "uint8"},
-                {"name": "signatureType", "type": "uint8"},
+_ORDER_DOMAIN_NAME = "Polymarket CTF Exchange"
+_ORDER_DOMAIN_VERSION = "1"
+_EIP712_DOMAIN_TYPEHASH = keccak(
+    text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+_ORDER_TYPEHASH = keccak(
+    text=(
+        "Order(uint256 salt,address maker,address signer,address taker,uint256 tokenId,"
+        "uint256 makerAmount,uint256 takerAmount,uint256 expiration,uint256 nonce,"
+        "uint256 feeRateBps,uint8 side,uint8 signatureType)"
+    )
+)
+_ADDRESS_WORD_PAD = bytes(12)
+
+
+@lru_cache(maxsize=16)
+def _order_domain_separator(exchange_address: str) -> bytes:
+    return keccak(
+        abi_encode(
+            ["bytes32", "bytes32", "bytes32", "uint256", "address"],
+            [
+                _EIP712_DOMAIN_TYPEHASH,
+                keccak(text=_ORDER_DOMAIN_NAME),
+                keccak(text=_ORDER_DOMAIN_VERSION),
+                int(CHAIN_ID),
+                exchange_address,
             ],
-        },
-        "primaryType": "Order",
-        "domain": {
-            "name": "Polymarket CTF Exchange",
-            "version": "1",
-            "chainId": int(CHAIN_ID),
-            "verifyingContract": exchange_address,
-        },
-        "message": {
-            "salt": _to_int_or_raise(signed_order.get("salt"), "salt"),
-            "maker": str(signed_order.get("maker") or ""),
-            "signer": str(signed_order.get("signer") or ""),
-            "taker": str(signed_order.get("taker") or ""),
-            "tokenId": _to_int_or_raise(signed_order.get("tokenId"), "tokenId"),
-            "makerAmount": _to_int_or_raise(signed_order.get("makerAmount"), "makerAmount"),
-            "takerAmount": _to_int_or_raise(signed_order.get("takerAmount"), "takerAmount"),
-            "expiration": _to_int_or_raise(signed_order.get("expiration"), "expiration"),
-            "nonce": _to_int_or_raise(signed_order.get("nonce"), "nonce"),
-            "feeRateBps": _to_int_or_raise(signed_order.get("feeRateBps"), "feeRateBps"),
-            "side": _order_side_to_uint8(signed_order.get("side")),
-            "signatureType": _to_int_or_raise(signed_order.get("signatureType"), "signatureType"),
-        },
-    }
-    signable = encode_typed_data(full_message=typed)
-    signature = str(signed_order.get("signature") or "")
-    if not signature:
-        raise HTTPException(status_code=400, detail="signed_order.signature is missing")
-    return Account.recover_message(signable, signature=signature)
+        )
+    )
+
+
+def _uint_word(value: int, bits: int) -> bytes:
+    if value < 0 or value.bit_length() > bits:
+        raise ValueError(f"value out of uint{bits} range")
+    return value.to_bytes(32, "big")
+
+
+def _address_word(value: str) -> bytes:
+    raw = address_bytes(value)
+    if raw is None:
+        raise ValueError(f"invalid address {value!r}")
+    return _ADDRESS_WORD_PAD + raw
+
+
+def _order_struct_hash(signed_order: ParsedSignedOrder) -> bytes:
+    # Every Order field is a static type, so the ABI encoding is just 32-byte words.
+    return keccak(
+        b"".join(
+            (
+                _ORDER_TYPEHASH,
+                _uint_word(signed_order.salt, 256),
+                _address_word(signed_order.maker),
+                _address_word(signed_order.signer),
+                _address_word(signed_order.taker),
+                _uint_word(signed_order.tokenId, 256),
+                _uint_word(signed_order.makerAmount, 256),
+                _uint_word(signed_order.takerAmount, 256),
+                _uint_word(signed_order.expiration, 256),
+                _uint_word(signed_order.nonce, 256),
+                _uint_word(signed_order.feeRateBps, 256),
+                _uint_word(0 if signed_order.side == "BUY" else 1, 8),
+                _uint_word(signed_order.signatureType, 8),
+            )
+        )
+    )
+
+
+def _order_digest(struct_hash: bytes, exchange_address: str) -> bytes:
+    # EIP-712 digest: keccak(0x1901 || domainSeparator || hashStruct(order)).
+    return keccak(b"\x19\x01" + _order_domain_separator(exchange_address) + struct_hash)
 
 
-def _recover_order_signer_candidates(signed_order: Dict[str, Any]) -> Dict[str, Optional[str]]:
-    regular = get_contract_config(CHAIN_ID, False).exchange
-    neg_risk = get_contract_config(CHAIN_ID, True).exchange
-    out: Dict[str, Optional[str]] = {}
-    for label, exchange in [("regular", regular), ("neg_risk", neg_risk)]:
+def _recover_order_signer_candidates(
+    signed_order: ParsedSignedOrder,
+    expected_signer: Optional[str] = None,
+) -> Dict[str, Optional[str]]:
+    # The struct hash is shared; only the domain separator differs per exchange. With an
+    # expected signer we stop at the first exchange that recovers to it.
+    out: Dict[str, Optional[str]] = {"regular": None, "neg_risk": None}
+    signature = signed_order.signature
+    if not signature:
+        return out
+    try:
+        struct_hash = _order_struct_hash(signed_order)
+    except Exception:
+        return out
+
+    expected = (expected_signer or "").lower()
+    for label, exchange in [("regular", REGULAR_EXCHANGE), ("neg_risk", NEG_RISK_EXCHANGE)]:
         try:
-            out[label] = _recover_order_signer_for_exchange(signed_order, exchange)
+            out[label] = auth.recover_hash_signer(_order_digest(struct_hash, exchange), signature)
         except Exception:
             out[label] = None
+        if expected and str(out[label] or "").lower() == expected:
+            break
     return out
 
 
@@ -276,37 +290,64 @@ def _get_order_snapshot(client: Level2SessionClobClient, order_id: Optional[str]
 
 
 def _validate_signed_order(
-    signed_order: Dict[str, Any],
+    signed_order: ParsedSignedOrder,
     session: Dict[str, Any],
     token_id: str,
     expected_side: str,
 ) -> None:
     context = session["trading_context"]
-    expected_signer = _to_lower(session["eoa_address"])
-    expected_maker = _to_lower(context.get("trading_address"))
+    expected_signer = session["eoa_address_bytes"]
+    expected_maker = session["trading_address_bytes"]
     expected_sig_type = int(context.get("signature_type") or 0)
 
-    signer = _to_lower(signed_order.get("signer"))
-    maker = _to_lower(signed_order.get("maker"))
-
-    if signer != expected_signer:
+    if expected_signer is None or address_bytes(signed_order.signer) != expected_signer:
         raise HTTPException(status_code=400, detail="Signed order signer mismatch")
 
-    if maker != expected_maker:
+    if expected_maker is None or address_bytes(signed_order.maker) != expected_maker:
         raise HTTPException(status_code=400, detail="Signed order maker mismatch")
 
-    order_sig_type = int(signed_order.get("signatureType"))
-    if order_sig_type != expected_sig_type:
+    if signed_order.signatureType != expected_sig_type:
         raise HTTPException(status_code=400, detail="signatureType mismatch")
 
-    if str(signed_order.get("tokenId")) != str(token_id):
+    if str(signed_order.tokenId) != str(token_id):
         raise HTTPException(status_code=400, detail="tokenId mismatch")
 
-    side = _normalize_side(signed_order.get("side"))
-    if side != expected_side:
+    if signed_order.side != expected_side:
         raise HTTPException(status_code=400, detail=f"Expected {expected_side} order")
 
 
+def _recovers_to_signer(recovered: Dict[str, Optional[str]], expected_signer: str) -> bool:
+    return any(str(addr or "").lower() == expected_signer for addr in recovered.values())
+
+
+def _verify_signed_orders_batch(
+    signed_orders: List[ParsedSignedOrder],
+    session: Dict[str, Any],
+    token_id: str,
+    expected_side: str,
+) -> None:
+    for signed_order in signed_orders:
+        _validate_signed_order(
+            signed_order=signed_order,
+            session=session,
+            token_id=token_id,
+            expected_side=expected_side,
+        )
+
+    # Domain separators are cached, so each order only costs a struct hash plus ecrecover.
+    expected_signer = str(session["eoa_address"]).lower()
+    for idx, signed_order in enumerate(signed_orders):
+        candidates = _recover_order_signer_candidates(signed_order, expected_signer)
+        if not _recovers_to_signer(candidates, expected_signer):
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Signed order #{idx} does not recover to authenticated EOA for either "
+                    "regular or neg-risk exchange contract."
+                ),
+            )
+
+
 def _session_from_cookie(session_token: Optional[str] = Cookie(default=None, alias=SESSION_COOKIE_NAME)):
     if not session_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
@@ -357,6 +398,8 @@ def verify_auth(payload: VerifyRequest, request: Request, response: Response):
         chain_id=payload.chain_id,
     )
 
+    # Dome wallet lookup and CLOB credential derivation hit different hosts; overlap them.
+    context_future = resolve_pool.submit(resolver.resolve, address)
     clob_creds = auth.derive_clob_api_creds(
         address=address,
         signature=payload.clob_auth_signature,
@@ -364,7 +407,7 @@ def verify_auth(payload: VerifyRequest, request: Request, response: Response):
         nonce=payload.clob_auth_nonce,
     )
 
-    context = resolver.resolve(address)
+    context = context_future.result()
     session = store.create_session(
         eoa_address=address,
         clob_creds=clob_creds,
@@ -390,13 +433,11 @@ def verify_auth(payload: VerifyRequest, request: Request, response: Response):
 
 @app.get("/api/me")
 def get_me(session: Dict[str, Any] = Depends(_session_from_cookie)):
-    return {
-        "eoa_address": session["eoa_address"],
-        "trading_context": session["trading_context"],
-    }
+    return Response(content=session["me_json"], media_type="application/json")
 
 
-@app.get("/api/search", response_model=list[SearchResult])
+# Rows are built by the resolver in SearchResult's shape; the model is only used for docs.
+@app.get("/api/search", responses={200: {"model": list[SearchResult]}})
 def search_markets(
     query: str = Query(..., min_length=2, max_length=100),
     session: Dict[str, Any] = Depends(_session_from_cookie),
@@ -405,31 +446,45 @@ def search_markets(
     return resolver.search(query, limit=20)
 
 
+async def _fetch_order_book(token_id: str) -> Any:
+    try:
+        return await asyncio.to_thread(public_clob.get_order_book, token_id)
+    except Exception:
+        return None
+
+
 @app.get("/api/token/meta")
-def get_token_meta(
+async def get_token_meta(
     token_id: str = Query(..., min_length=10, max_length=200),
     session: Dict[str, Any] = Depends(_session_from_cookie),
 ):
     _ = session
     try:
-        neg_risk = bool(public_clob.get_neg_risk(token_id))
-        tick_size = str(public_clob.get_tick_size(token_id))
-        fee_rate_bps = int(public_clob.get_fee_rate_bps(token_id) or 0)
-        exchange_address = get_contract_config(CHAIN_ID, neg_risk).exchange
+        # Four independent CLOB round-trips; run them side by side instead of back to back.
+        neg_risk_raw, tick_size_raw, fee_rate_raw, book = await asyncio.gather(
+            asyncio.to_thread(public_clob.get_neg_risk, token_id),
+            asyncio.to_thread(public_clob.get_tick_size, token_id),
+            asyncio.to_thread(public_clob.get_fee_rate_bps, token_id),
+            _fetch_order_book(token_id),
+        )
+        neg_risk = bool(neg_risk_raw)
+        tick_size = str(tick_size_raw)
+        fee_rate_bps = int(fee_rate_raw or 0)
+        exchange_address = NEG_RISK_EXCHANGE if neg_risk else REGULAR_EXCHANGE
         min_order_size = None
         market = None
         best_bid = None
         best_ask = None
         try:
-            book = public_clob.get_order_book(token_id)
-            market = getattr(book, "market", None)
-            min_order_size = str(getattr(book, "min_order_size", None) or "") or None
-            bids = list(getattr(book, "bids", None) or [])
-            asks = list(getattr(book, "asks", None) or [])
-            if bids:
-                best_bid = str(getattr(bids[0], "price", None) or "") or None
-            if asks:
-                best_ask = str(getattr(asks[0], "price", None) or "") or None
+            if book is not None:
+                market = getattr(book, "market", None)
+                min_order_size = str(getattr(book, "min_order_size", None) or "") or None
+                bids = list(getattr(book, "bids", None) or [])
+                asks = list(getattr(book, "asks", None) or [])
+                if bids:
+                    best_bid = str(getattr(bids[0], "price", None) or "") or None
+                if asks:
+                    best_ask = str(getattr(asks[0], "price", None) or "") or None
         except Exception:
             pass
         return {
@@ -552,10 +607,45 @@ def cancel_order(
     }
 
 
-@app.post("/api/order/limit")
+async def _limit_order_body(request: Request) -> LimitOrderRequest:
+    # Validate the raw bytes in pydantic-core instead of json.loads + dict validation.
+    try:
+        return LimitOrderRequest.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        ) from exc
+
+
+_LIMIT_ORDER_SCHEMA = LimitOrderRequest.model_json_schema(ref_template="#/components/schemas/{model}")
+# The body's nested models (ParsedSignedOrder) are registered as components by _openapi below.
+_LIMIT_ORDER_DEFS = _LIMIT_ORDER_SCHEMA.pop("$defs", {})
+_default_openapi = app.openapi
+
+
+def _openapi() -> Dict[str, Any]:
+    if app.openapi_schema is None:
+        schemas = _default_openapi().setdefault("components", {}).setdefault("schemas", {})
+        for name, definition in _LIMIT_ORDER_DEFS.items():
+            schemas.setdefault(name, definition)
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+
+@app.post(
+    "/api/order/limit",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _LIMIT_ORDER_SCHEMA}},
+        }
+    },
+)
 def place_limit_order(
-    payload: LimitOrderRequest,
     session: Dict[str, Any] = Depends(_session_from_cookie),
+    payload: LimitOrderRequest = Depends(_limit_order_body),
 ):
     if payload.idempotency_key and not store.mark_idempotent(payload.idempotency_key):
         return {"status": "duplicate", "detail": "idempotency_key already used"}
@@ -575,11 +665,9 @@ def place_limit_order(
         expected_side=payload.side,
     )
 
-    recovered = _recover_order_signer_candidates(payload.signed_order)
     expected_signer = str(session["eoa_address"]).lower()
-    rec_regular = str(recovered.get("regular") or "").lower()
-    rec_neg_risk = str(recovered.get("neg_risk") or "").lower()
-    if rec_regular != expected_signer and rec_neg_risk != expected_signer:
+    recovered = _recover_order_signer_candidates(payload.signed_order, expected_signer)
+    if not _recovers_to_signer(recovered, expected_signer):
         raise HTTPException(
             status_code=400,
             detail=(
@@ -588,33 +676,31 @@ def place_limit_order(
             ),
         )
 
-    print(
-        "[WEB_EXPERIMENT] place_limit_attempt",
-        {
-            "eoa": session["eoa_address"],
-            "maker": payload.signed_order.get("maker"),
-            "signer": payload.signed_order.get("signer"),
-            "token_id": payload.token_id,
-            "side": payload.side,
-            "price": payload.price,
-            "order_type": payload.order_type,
-            "signature_type": payload.signed_order.get("signatureType"),
-            "salt": payload.signed_order.get("salt"),
-            "nonce": payload.signed_order.get("nonce"),
-            "maker_amount": payload.signed_order.get("makerAmount"),
-            "taker_amount": payload.signed_order.get("takerAmount"),
-            "fee_rate_bps": payload.signed_order.get("feeRateBps"),
-            "salt_type": type(payload.signed_order.get("salt")).__name__,
-            "nonce_type": type(payload.signed_order.get("nonce")).__name__,
-            "token_id_type": type(payload.signed_order.get("tokenId")).__name__,
-            "recovered_regular": recovered.get("regular"),
-            "recovered_neg_risk": recovered.get("neg_risk"),
-        },
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[WEB_EXPERIMENT] place_limit_attempt %s",
+            {
+                "eoa": session["eoa_address"],
+                "maker": payload.signed_order.maker,
+                "signer": payload.signed_order.signer,
+                "token_id": payload.token_id,
+                "side": payload.side,
+                "price": payload.price,
+                "order_type": payload.order_type,
+                "signature_type": payload.signed_order.signatureType,
+                "salt": payload.signed_order.salt,
+                "nonce": payload.signed_order.nonce,
+                "maker_amount": payload.signed_order.makerAmount,
+                "taker_amount": payload.signed_order.takerAmount,
+                "fee_rate_bps": payload.signed_order.feeRateBps,
+                "recovered_regular": recovered.get("regular"),
+                "recovered_neg_risk": recovered.get("neg_risk"),
+            },
+        )
 
     try:
         result = client.post_signed_order(
-            signed_order=payload.signed_order,
+            signed_order=payload.signed_order.model_dump(),
             order_type=payload.order_type,
         )
     except PolyApiException as exc:
@@ -636,24 +722,25 @@ def place_limit_order(
         entry_size_tokens = _calc_order_size_tokens(payload.signed_order)
     order_snapshot = _get_order_snapshot(client, order_id)
 
-    print(
-        "[WEB_EXPERIMENT] limit_order",
-        {
-            "eoa": session["eoa_address"],
-            "trading_address": context.get("trading_address"),
-            "token_id": payload.token_id,
-            "side": payload.side,
-            "price": payload.price,
-            "order_id": order_id,
-            "entry_size_tokens": entry_size_tokens,
-            "snapshot_ok": order_snapshot.get("ok"),
-            "snapshot_status": (
-                (order_snapshot.get("order") or {}).get("status")
-                if isinstance(order_snapshot.get("order"), dict)
-                else None
-            ),
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[WEB_EXPERIMENT] limit_order %s",
+            {
+                "eoa": session["eoa_address"],
+                "trading_address": context.get("trading_address"),
+                "token_id": payload.token_id,
+                "side": payload.side,
+                "price": payload.price,
+                "order_id": order_id,
+                "entry_size_tokens": entry_size_tokens,
+                "snapshot_ok": order_snapshot.get("ok"),
+                "snapshot_status": (
+                    (order_snapshot.get("order") or {}).get("status")
+                    if isinstance(order_snapshot.get("order"), dict)
+                    else None
+                ),
+            },
+        )
 
     return {
         "status": "success",
@@ -669,15 +756,17 @@ async def arm_tp(
     payload: TpArmRequest,
     session: Dict[str, Any] = Depends(_session_from_cookie),
 ):
-    for item in payload.signed_tp_orders:
-        _validate_signed_order(
-            signed_order=item.signed_order,
-            session=session,
-            token_id=payload.token_id,
-            expected_side="SELL",
-        )
+    _verify_signed_orders_batch(
+        signed_orders=[item.signed_order for item in payload.signed_tp_orders],
+        session=session,
+        token_id=payload.token_id,
+        expected_side="SELL",
+    )
 
-    arm_state = tp_engine.arm(session=session, payload=payload.model_dump())
+    try:
+        arm_state = tp_engine.arm(session=session, payload=payload.model_dump(mode="json"))
+    except TpCapacityExceeded as exc:
+        raise HTTPException(status_code=429, detail="Too many active TP arms") from exc
     return {
         "status": "armed",
         "arm_id": arm_state["arm_id"],
@@ -685,14 +774,50 @@ async def arm_tp(
     }
 
 
-@app.get("/api/tp/status", response_model=TpStatusResponse)
+@app.get("/api/tp/status", responses={200: {"model": TpStatusResponse}})
 def get_tp_status(
     arm_id: Optional[str] = Query(default=None),
     session: Dict[str, Any] = Depends(_session_from_cookie),
 ):
     arms = tp_engine.get_status(eoa_address=session["eoa_address"], arm_id=arm_id)
-    return TpStatusResponse(arms=arms)
+    return {"arms": arms}
 
 
 UI_DIR = Path(__file__).resolve().parents[1] / "ui"
-app.mount("/", StaticFiles(directory=str(UI_DIR), html=True), name="ui")
+
+
+def _load_ui_files(root: Path) -> Dict[str, Tuple[bytes, str, Dict[str, str]]]:
+    # The UI is small and immutable per deploy: read it once so static hits never touch disk.
+    files: Dict[str, Tuple[bytes, str, Dict[str, str]]] = {}
+    for path in root.rglob("*"):
+        if not path.is_file():
+            continue
+        body = path.read_bytes()
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        cache_control = (
+            "no-cache"
+            if media_type == "text/html"
+            else f"public, max-age={UI_CACHE_MAX_AGE_SECONDS}"
+        )
+        headers = {
+            "etag": f'"{hashlib.md5(body).hexdigest()}"',
+            "cache-control": cache_control,
+        }
+        files[path.relative_to(root).as_posix()] = (body, media_type, headers)
+    return files
+
+
+UI_FILES = _load_ui_files(UI_DIR)
+
+
+@app.api_route("/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def serve_ui(path: str, request: Request) -> Response:
+    if not path or path.endswith("/"):
+        path += "index.html"
+    cached = UI_FILES.get(path)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    body, media_type, headers = cached
+    if request.headers.get("if-none-match") == headers["etag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -1,21 +1,28 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_serializer, field_validator
 
+from .config import MAX_SAFE_JSON_INT
 
-class NonceRequest(BaseModel):
+
+class _FrozenModel(BaseModel):
+    # Payloads are validated once and then only read (sometimes from worker threads).
+    model_config = ConfigDict(frozen=True)
+
+
+class NonceRequest(_FrozenModel):
     address: str = Field(..., min_length=42, max_length=42)
 
 
-class NonceResponse(BaseModel):
+class NonceResponse(_FrozenModel):
     nonce: str
     message: str
     chain_id: int
 
 
-class VerifyRequest(BaseModel):
+class VerifyRequest(_FrozenModel):
     address: str = Field(..., min_length=42, max_length=42)
     nonce: str = Field(..., min_length=8)
     message: str = Field(..., min_length=20)
@@ -27,7 +34,7 @@ class VerifyRequest(BaseModel):
     clob_auth_nonce: int
 
 
-class SearchResult(BaseModel):
+class SearchResult(_FrozenModel):
     market_id: str
     title: str
     question: Optional[str] = None
@@ -40,7 +47,79 @@ class SearchResult(BaseModel):
     source: str = "dome"
 
 
-class LimitOrderRequest(BaseModel):
+# parse_uint turns hex and decimal strings into ints first; strict then refuses floats and
+# "1.0"-style strings that lax int parsing would coerce.
+_Uint = Annotated[int, Field(strict=True, ge=0)]
+
+
+class ParsedSignedOrder(_FrozenModel):
+    # salt and signatureType stay JSON numbers, so they are bounded here (as the CLOB payload
+    # builder bounds salt) rather than stringified like the uint256 fields below.
+    salt: _Uint = Field(..., le=MAX_SAFE_JSON_INT)
+    maker: str
+    signer: str
+    taker: str
+    tokenId: _Uint
+    makerAmount: _Uint
+    takerAmount: _Uint
+    expiration: _Uint
+    nonce: _Uint
+    feeRateBps: _Uint
+    side: Literal["BUY", "SELL"]
+    signatureType: _Uint = Field(..., le=255)
+    signature: str
+
+    @field_validator(
+        "salt",
+        "tokenId",
+        "makerAmount",
+        "takerAmount",
+        "expiration",
+        "nonce",
+        "feeRateBps",
+        "signatureType",
+        mode="before",
+    )
+    @classmethod
+    def parse_uint(cls, value: Any, info: ValidationInfo) -> Any:
+        kind = type(value)
+        if kind is int:
+            return value
+        if kind is str:
+            text = value.strip()
+            return int(text, 16) if text[:2] in ("0x", "0X") else int(text)
+        if kind is bool:
+            raise ValueError(f"{info.field_name} must be integer-like")
+        return value
+
+    @field_validator("side", mode="before")
+    @classmethod
+    def parse_side(cls, value: Any) -> str:
+        if isinstance(value, str):
+            text = value.strip().upper()
+            if text in {"BUY", "0"}:
+                return "BUY"
+            if text in {"SELL", "1"}:
+                return "SELL"
+        elif isinstance(value, int) and not isinstance(value, bool) and value in {0, 1}:
+            return "BUY" if value == 0 else "SELL"
+        raise ValueError(f"side must be BUY/SELL or 0/1, got {value!r}")
+
+    # uint256 values overflow JSON/orjson integers; emit them as decimal strings in JSON mode.
+    @field_serializer(
+        "tokenId",
+        "makerAmount",
+        "takerAmount",
+        "expiration",
+        "nonce",
+        "feeRateBps",
+        when_used="json",
+    )
+    def serialize_uint256(self, value: int) -> str:
+        return str(value)
+
+
+class LimitOrderRequest(_FrozenModel):
     token_id: str = Field(..., min_length=10)
     side: Literal["BUY", "SELL"]
     outcome: Optional[Literal["YES", "NO"]] = None
@@ -49,48 +128,25 @@ class LimitOrderRequest(BaseModel):
     size_tokens: Optional[float] = Field(default=None, gt=0)
     order_type: Literal["GTC", "GTD", "FOK", "FAK"] = "GTC"
     idempotency_key: Optional[str] = None
-    signed_order: Dict[str, Any]
-
-    @field_validator("signed_order")
-    @classmethod
-    def validate_signed_order(cls, value: Dict[str, Any]) -> Dict[str, Any]:
-        required = [
-            "salt",
-            "maker",
-            "signer",
-            "taker",
-            "tokenId",
-            "makerAmount",
-            "takerAmount",
-            "expiration",
-            "nonce",
-            "feeRateBps",
-            "side",
-            "signatureType",
-            "signature",
-        ]
-        missing = [k for k in required if k not in value]
-        if missing:
-            raise ValueError(f"signed_order missing fields: {', '.join(missing)}")
-        return value
+    signed_order: ParsedSignedOrder
 
 
-class CancelOrderRequest(BaseModel):
+class CancelOrderRequest(_FrozenModel):
     order_id: str = Field(..., min_length=6, max_length=200)
 
 
-class TpLevel(BaseModel):
+class TpLevel(_FrozenModel):
     price: float = Field(..., gt=0, lt=1)
     size_pct: float = Field(..., gt=0, le=100)
 
 
-class SignedTpOrder(BaseModel):
+class SignedTpOrder(_FrozenModel):
     level_index: int = Field(..., ge=0, le=9)
     order_type: Literal["GTC", "GTD", "FOK", "FAK"] = "GTC"
-    signed_order: Dict[str, Any]
+    signed_order: ParsedSignedOrder
 
 
-class TpArmRequest(BaseModel):
+class TpArmRequest(_FrozenModel):
     entry_order_id: str = Field(..., min_length=4)
     token_id: str = Field(..., min_length=10)
     entry_size_tokens: float = Field(..., gt=0)
@@ -108,5 +164,5 @@ class TpArmRequest(BaseModel):
         return levels
 
 
-class TpStatusResponse(BaseModel):
+class TpStatusResponse(_FrozenModel):
     arms: List[Dict[str, Any]]
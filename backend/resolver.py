@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import json
 import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 import requests
 from eth_utils import is_address
 
@@ -11,108 +18,123 @@ from .integrations.market_fallback import get_all_markets
 
 from .config import CHAIN_ID, DEFAULT_EXCHANGE_ADDRESS
 from .config import FORCE_SIGNATURE_TYPE, FORCE_TRADING_ADDRESS
+from .utils import NO_KEY, child_entries, parse_json
 
 
-_ADDRESS_RE = re.compile(r"0x[a-fA-F0-9]{40}")
-_PROXY_KEYS = {
-    "proxy",
-    "proxywallet",
-    "proxy_wallet",
-    "proxyaddress",
-    "proxy_address",
-    "safe",
-    "safeaddress",
-    "safe_address",
-}
-
-_AVAILABLE_BALANCE_KEYS = {
-    "available",
-    "available_balance",
-    "available_usdc",
-    "usdc_available",
-    "free",
-    "free_balance",
-    "spendable",
-    "buying_power",
-    "buyingpower",
-}
-
-_TOTAL_BALANCE_KEYS = {
-    "balance",
-    "total",
-    "total_balance",
-    "total_usdc",
-    "usdc_balance",
-    "cash_balance",
-    "collateral",
-    "equity",
-}
-
-_USDC_SCOPE_KEYS = {
-    "usdc",
-    "usd",
-    "cash",
-    "stablecoin",
-    "stablecoins",
-    "balances",
-}
-
+_GAMMA_MARKETS_URL = "https://gamma-api.polymarket.com/markets"
+_GAMMA_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gamma-lookup")
+_GAMMA_CACHE_TTL_SECONDS = 300.0
+_GAMMA_CACHE_MAX_ENTRIES = 4096
+_GAMMA_CACHE_LOCK = threading.Lock()
+_GAMMA_CACHE: Dict[str, Tuple[float, Tuple[Optional[str], Optional[str]]]] = {}
 
+_ADDRESS_RE = re.compile(r"0x[a-fA-F0-9]{40}")
+_ADDRESS_FULL_RE = re.compile(r"(?:0[xX])?[a-fA-F0-9]{40}\Z")
+_address_search = _ADDRESS_RE.search
+_PROXY_KEYS = frozenset(
+    {
+        "proxy",
+        "proxywallet",
+        "proxy_wallet",
+        "proxyaddress",
+        "proxy_address",
+        "safe",
+        "safeaddress",
+        "safe_address",
+    }
+)
+
+# Alias lists are in priority order: the first present, non-empty key wins.
+_YES_TOKEN_KEYS = ("clob_token_yes", "clobTokenYes", "yes_token_id", "yesTokenId", "token_yes")
+_NO_TOKEN_KEYS = ("clob_token_no", "clobTokenNo", "no_token_id", "noTokenId", "token_no")
+_YES_LABEL_KEYS = ("yes_label", "yes_outcome", "outcome_yes", "yesOutcome")
+_NO_LABEL_KEYS = ("no_label", "no_outcome", "outcome_no", "noOutcome")
+_SIDE_A_ID_KEYS = ("side_a_id", "sideAId")
+_SIDE_B_ID_KEYS = ("side_b_id", "sideBId")
+_SIDE_A_LABEL_KEYS = ("side_a_label", "sideALabel")
+_SIDE_B_LABEL_KEYS = ("side_b_label", "sideBLabel")
+
+_AVAILABLE_BALANCE_KEYS = frozenset(
+    {
+        "available",
+        "available_balance",
+        "available_usdc",
+        "usdc_available",
+        "free",
+        "free_balance",
+        "spendable",
+        "buying_power",
+        "buyingpower",
+    }
+)
+
+_TOTAL_BALANCE_KEYS = frozenset(
+    {
+        "balance",
+        "total",
+        "total_balance",
+        "total_usdc",
+        "usdc_balance",
+        "cash_balance",
+        "collateral",
+        "equity",
+    }
+)
+
+_USDC_SCOPE_KEYS = frozenset(
+    {
+        "usdc",
+        "usd",
+        "cash",
+        "stablecoin",
+        "stablecoins",
+        "balances",
+    }
+)
+
+
+# Payload keys come from a small, repeating vocabulary; typed so 1/True/1.0 keys stay distinct.
+@lru_cache(maxsize=2048, typed=True)
 def _normalize_key(value: Any) -> str:
-    return str(value or "").strip().replace("-", "_").lower()
+    return sys.intern(str(value or "").strip().replace("-", "_").lower())
 
 
 def _to_float(value: Any) -> Optional[float]:
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
+    kind = type(value)
+    if kind is float:
+        return value
+    if kind is int:
         return float(value)
-    if isinstance(value, str):
+    if kind is str:
+        # str.replace returns the same object when there is no comma, unlike translate().
         cleaned = value.strip().replace(",", "")
-        if cleaned.startswith("$"):
+        if cleaned[:1] == "$":
             cleaned = cleaned[1:]
         if not cleaned:
             return None
         try:
             return float(cleaned)
-        except Exception:
+        except ValueError:
             return None
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return _to_float(str(value))
     return None
 
 
-def _find_first_numeric(obj: Any, keys: set[str]) -> Optional[float]:
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            if _normalize_key(key) in keys:
-                numeric = _to_float(value)
-                if numeric is not None:
-                    return numeric
-        for value in obj.values():
-            nested = _find_first_numeric(value, keys)
-            if nested is not None:
-                return nested
-    elif isinstance(obj, list):
-        for item in obj:
-            nested = _find_first_numeric(item, keys)
-            if nested is not None:
-                return nested
-    return None
+# The wallet summary walk is an iterative pre-order traversal: children are pushed in reverse so
+# they pop in document order, matching the first-hit semantics of a recursive walk.
 
 
-def _find_usdc_scope(obj: Any) -> Any:
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            if _normalize_key(key) in _USDC_SCOPE_KEYS:
-                return value
-        for value in obj.values():
-            nested = _find_usdc_scope(value)
-            if nested is not None:
-                return nested
-    elif isinstance(obj, list):
-        for item in obj:
-            nested = _find_usdc_scope(item)
-            if nested is not None:
-                return nested
+def _first_numeric_in_dict(obj: Dict[Any, Any], keys: frozenset[str]) -> Optional[float]:
+    for key, value in obj.items():
+        if _normalize_key(key) in keys:
+            numeric = _to_float(value)
+            if numeric is not None:
+                return numeric
     return None
 
 
@@ -120,16 +142,59 @@ def _extract_wallet_summary(wallet_data: Any) -> Optional[Dict[str, float]]:
     if not isinstance(wallet_data, (dict, list)):
         return None
 
-    scope = _find_usdc_scope(wallet_data)
-    search_target = scope if scope is not None else wallet_data
-
-    available = _find_first_numeric(search_target, _AVAILABLE_BALANCE_KEYS)
-    total = _find_first_numeric(search_target, _TOTAL_BALANCE_KEYS)
+    # One walk fills both slots. The "USDC scope" is the value under the first scope key found
+    # (a None value hides that dict's subtree from the scope search only); balances inside it win
+    # over the first balances found anywhere in the payload.
+    scoped_available: Optional[float] = None
+    scoped_total: Optional[float] = None
+    available: Optional[float] = None
+    total: Optional[float] = None
+    scope_found = False
+
+    # Entries are (node, inside scope, eligible to hold the scope key).
+    stack: List[Tuple[Any, bool, bool]] = [(wallet_data, False, True)]
+    while stack:
+        cur, in_scope, searchable = stack.pop()
+        if isinstance(cur, dict):
+            scope_key: Any = NO_KEY
+            if searchable and not scope_found:
+                for key, value in cur.items():
+                    if _normalize_key(key) in _USDC_SCOPE_KEYS:
+                        if value is None:
+                            searchable = False
+                        else:
+                            scope_found = True
+                            scope_key = key
+                        break
+
+            if available is None or (in_scope and scoped_available is None):
+                hit = _first_numeric_in_dict(cur, _AVAILABLE_BALANCE_KEYS)
+                if hit is not None:
+                    if available is None:
+                        available = hit
+                    if in_scope and scoped_available is None:
+                        scoped_available = hit
+            if total is None or (in_scope and scoped_total is None):
+                hit = _first_numeric_in_dict(cur, _TOTAL_BALANCE_KEYS)
+                if hit is not None:
+                    if total is None:
+                        total = hit
+                    if in_scope and scoped_total is None:
+                        scoped_total = hit
+            if scoped_available is not None and scoped_total is not None:
+                break
+
+            stack.extend(
+                (value, in_scope or key == scope_key, searchable)
+                for key, value in reversed(cur.items())
+            )
+        elif isinstance(cur, list):
+            stack.extend((item, in_scope, searchable) for item in reversed(cur))
 
-    if available is None:
-        available = _find_first_numeric(wallet_data, _AVAILABLE_BALANCE_KEYS)
-    if total is None:
-        total = _find_first_numeric(wallet_data, _TOTAL_BALANCE_KEYS)
+    if scoped_available is not None:
+        available = scoped_available
+    if scoped_total is not None:
+        total = scoped_total
 
     out: Dict[str, float] = {}
     if available is not None:
@@ -151,29 +216,31 @@ def _clean_label(value: Any) -> Optional[str]:
     return text
 
 
+def _first_truthy(source: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    # Same result as source.get(k1) or source.get(k2) or ..., including the last falsy value.
+    value = None
+    for key in keys:
+        value = source.get(key)
+        if value:
+            return value
+    return value
+
+
 def _extract_outcome_labels_from_market(
     market: Dict[str, Any],
     yes_token: Optional[str],
     no_token: Optional[str],
 ) -> Tuple[Optional[str], Optional[str]]:
-    yes_label = _clean_label(
-        market.get("yes_label")
-        or market.get("yes_outcome")
-        or market.get("outcome_yes")
-        or market.get("yesOutcome")
-    )
-    no_label = _clean_label(
-        market.get("no_label")
-        or market.get("no_outcome")
-        or market.get("outcome_no")
-        or market.get("noOutcome")
-    )
+    yes_label = _clean_label(_first_truthy(market, _YES_LABEL_KEYS))
+    no_label = _clean_label(_first_truthy(market, _NO_LABEL_KEYS))
 
-    dome_raw = market.get("dome_raw") if isinstance(market.get("dome_raw"), dict) else {}
-    side_a_id = dome_raw.get("side_a_id") or dome_raw.get("sideAId")
-    side_b_id = dome_raw.get("side_b_id") or dome_raw.get("sideBId")
-    side_a_label = _clean_label(dome_raw.get("side_a_label") or dome_raw.get("sideALabel"))
-    side_b_label = _clean_label(dome_raw.get("side_b_label") or dome_raw.get("sideBLabel"))
+    dome_raw = market.get("dome_raw")
+    if not isinstance(dome_raw, dict):
+        dome_raw = {}
+    side_a_id = _first_truthy(dome_raw, _SIDE_A_ID_KEYS)
+    side_b_id = _first_truthy(dome_raw, _SIDE_B_ID_KEYS)
+    side_a_label = _clean_label(_first_truthy(dome_raw, _SIDE_A_LABEL_KEYS))
+    side_b_label = _clean_label(_first_truthy(dome_raw, _SIDE_B_LABEL_KEYS))
 
     yes_token_str = str(yes_token) if yes_token is not None else None
     no_token_str = str(no_token) if no_token is not None else None
@@ -190,103 +257,112 @@ def _extract_outcome_labels_from_market(
     if not no_label and no_token_str and side_b_id_str == no_token_str:
         no_label = side_b_label
 
-    if not yes_label and side_a_label and side_a_label.lower() == "yes":
+    # _clean_label canonicalizes yes/no to "YES"/"NO", so no lowercasing is needed here.
+    if not yes_label and side_a_label == "YES":
         yes_label = side_a_label
-    if not yes_label and side_b_label and side_b_label.lower() == "yes":
+    if not yes_label and side_b_label == "YES":
         yes_label = side_b_label
 
-    if not no_label and side_a_label and side_a_label.lower() == "no":
+    if not no_label and side_a_label == "NO":
         no_label = side_a_label
-    if not no_label and side_b_label and side_b_label.lower() == "no":
+    if not no_label and side_b_label == "NO":
         no_label = side_b_label
 
     return yes_label, no_label
 
 
+def _hex_address_ok(value: str) -> bool:
+    # The regexes already guarantee the shape; only mixed-case input needs the EIP-55 checksum test.
+    body = value[-40:]
+    if body == body.lower() or body == body.upper():
+        return True
+    return is_address(value)
+
+
 def _normalize_addr(value: Any) -> Optional[str]:
     if not isinstance(value, str):
         return None
     value = value.strip()
-    if is_address(value):
-        return value
-    match = _ADDRESS_RE.search(value)
-    if match and is_address(match.group(0)):
+    if _ADDRESS_FULL_RE.match(value):
+        return value if _hex_address_ok(value) else None
+    # Most JSON strings (names, ids, amounts) cannot hold an embedded address; skip the regex.
+    if len(value) < 42 or "0x" not in value:
+        return None
+    match = _address_search(value)
+    if match and _hex_address_ok(match.group(0)):
         return match.group(0)
     return None
 
 
-def _find_proxy_in_obj(obj: Any, eoa_lower: str) -> Optional[str]:
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            key_norm = str(key).replace("-", "_").lower()
-            addr = _normalize_addr(value)
-            if addr and key_norm in _PROXY_KEYS and addr.lower() != eoa_lower:
-                return addr
-
-            nested = _find_proxy_in_obj(value, eoa_lower)
-            if nested:
-                return nested
-
-    elif isinstance(obj, list):
-        for item in obj:
-            nested = _find_proxy_in_obj(item, eoa_lower)
-            if nested:
-                return nested
+# The address hunters keep a stack of container iterators rather than nodes: each iterator resumes
+# where it left off (document order), and scalar leaves are checked in place, never pushed.
+
 
+def _find_proxy_in_obj(obj: Any, eoa_lower: str) -> Optional[str]:
+    if not isinstance(obj, (dict, list)):
+        return None
+    stack = [child_entries(obj)]
+    while stack:
+        for key, value in stack[-1]:
+            if isinstance(value, str):
+                if key is NO_KEY:
+                    continue
+                addr = _normalize_addr(value)
+                if (
+                    addr
+                    and str(key).replace("-", "_").lower() in _PROXY_KEYS
+                    and addr.lower() != eoa_lower
+                ):
+                    return addr
+            elif isinstance(value, (dict, list)):
+                stack.append(child_entries(value))
+                break
+        else:
+            stack.pop()
     return None
 
 
 def _find_any_alt_address(obj: Any, eoa_lower: str) -> Optional[str]:
-    if isinstance(obj, dict):
-        for value in obj.values():
-            addr = _normalize_addr(value)
-            if addr and addr.lower() != eoa_lower:
-                return addr
-            nested = _find_any_alt_address(value, eoa_lower)
-            if nested:
-                return nested
-    elif isinstance(obj, list):
-        for item in obj:
-            nested = _find_any_alt_address(item, eoa_lower)
-            if nested:
-                return nested
+    # Only dict values are candidates; strings directly inside lists are skipped.
+    if not isinstance(obj, (dict, list)):
+        return None
+    stack = [child_entries(obj)]
+    while stack:
+        for key, value in stack[-1]:
+            if isinstance(value, str):
+                if key is NO_KEY:
+                    continue
+                addr = _normalize_addr(value)
+                if addr and addr.lower() != eoa_lower:
+                    return addr
+            elif isinstance(value, (dict, list)):
+                stack.append(child_entries(value))
+                break
+        else:
+            stack.pop()
     return None
 
 
-def _extract_token_ids_from_market(market: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
-    def get_any(source: Dict[str, Any], keys: List[str]) -> Optional[str]:
-        for key in keys:
-            if key in source and source[key] not in (None, ""):
-                return str(source[key])
-        return None
+def _first_present(source: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[str]:
+    for key in keys:
+        value = source.get(key)
+        if value is not None and value != "":
+            return str(value)
+    return None
 
-    yes = get_any(
-        market,
-        [
-            "clob_token_yes",
-            "clobTokenYes",
-            "yes_token_id",
-            "yesTokenId",
-            "token_yes",
-        ],
-    )
-    no = get_any(
-        market,
-        [
-            "clob_token_no",
-            "clobTokenNo",
-            "no_token_id",
-            "noTokenId",
-            "token_no",
-        ],
-    )
+
+def _extract_token_ids_from_market(market: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    yes = _first_present(market, _YES_TOKEN_KEYS)
+    no = _first_present(market, _NO_TOKEN_KEYS)
 
     if yes and no:
         return yes, no
 
-    dome_raw = market.get("dome_raw") if isinstance(market.get("dome_raw"), dict) else {}
-    side_a_id = dome_raw.get("side_a_id") or dome_raw.get("sideAId")
-    side_b_id = dome_raw.get("side_b_id") or dome_raw.get("sideBId")
+    dome_raw = market.get("dome_raw")
+    if not isinstance(dome_raw, dict):
+        dome_raw = {}
+    side_a_id = _first_truthy(dome_raw, _SIDE_A_ID_KEYS)
+    side_b_id = _first_truthy(dome_raw, _SIDE_B_ID_KEYS)
     side_a_label = str(dome_raw.get("side_a_label") or "").lower()
     side_b_label = str(dome_raw.get("side_b_label") or "").lower()
 
@@ -303,63 +379,104 @@ def _extract_token_ids_from_market(market: Dict[str, Any]) -> Tuple[Optional[str
     return yes, no
 
 
-def _extract_token_ids_from_gamma(market_id: str) -> Tuple[Optional[str], Optional[str]]:
-    try:
-        response = requests.get(
-            "https://gamma-api.polymarket.com/markets",
-            params={"id": market_id},
-            timeout=10,
-        )
-        response.raise_for_status()
-        payload = response.json()
-
-        if isinstance(payload, list):
-            markets = payload
-        elif isinstance(payload, dict):
-            markets = payload.get("markets") or []
-        else:
-            markets = []
+def _fetch_token_ids_from_gamma(
+    market_id: str,
+    session: Optional[requests.Session] = None,
+) -> Tuple[Optional[str], Optional[str]]:
+    response = (session or requests).get(
+        _GAMMA_MARKETS_URL,
+        params={"id": market_id},
+        timeout=10,
+    )
+    response.raise_for_status()
+    payload = parse_json(response)
 
-        if not markets:
-            return None, None
+    if isinstance(payload, list):
+        markets = payload
+    elif isinstance(payload, dict):
+        markets = payload.get("markets") or []
+    else:
+        markets = []
 
-        m = markets[0]
+    if not markets:
+        return None, None
 
-        outcomes = m.get("outcomes")
-        if isinstance(outcomes, str):
-            import json
+    m = markets[0]
 
-            try:
-                outcomes = json.loads(outcomes)
-            except Exception:
-                outcomes = None
+    outcomes = m.get("outcomes")
+    if isinstance(outcomes, str):
+        try:
+            outcomes = orjson.loads(outcomes)
+        except Exception:
+            outcomes = None
 
-        clob_token_ids = m.get("clobTokenIds") or m.get("clob_token_ids")
-        if isinstance(clob_token_ids, str):
-            import json
+    clob_token_ids = m.get("clobTokenIds") or m.get("clob_token_ids")
+    if isinstance(clob_token_ids, str):
+        # stdlib json on purpose: orjson turns unquoted uint256 ids into floats.
+        try:
+            clob_token_ids = json.loads(clob_token_ids)
+        except Exception:
+            clob_token_ids = None
+
+    yes = None
+    no = None
+    if isinstance(outcomes, list) and isinstance(clob_token_ids, list):
+        for outcome, token in zip(outcomes, clob_token_ids):
+            out = str(outcome).lower()
+            if "yes" in out:
+                yes = str(token)
+            elif "no" in out:
+                no = str(token)
 
-            try:
-                clob_token_ids = json.loads(clob_token_ids)
-            except Exception:
-                clob_token_ids = None
+    return yes, no
 
-        yes = None
-        no = None
-        if isinstance(outcomes, list) and isinstance(clob_token_ids, list):
-            for outcome, token in zip(outcomes, clob_token_ids):
-                out = str(outcome).lower()
-                if "yes" in out:
-                    yes = str(token)
-                elif "no" in out:
-                    no = str(token)
 
-        return yes, no
+def _extract_token_ids_from_gamma(
+    market_id: str,
+    session: Optional[requests.Session] = None,
+) -> Tuple[Optional[str], Optional[str]]:
+    # Answers (including "no tokens") are cached per market id; failed requests are not, so the
+    # next search retries them.
+    now = time.monotonic()
+    cached = _GAMMA_CACHE.get(market_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    try:
+        tokens = _fetch_token_ids_from_gamma(market_id, session)
     except Exception:
         return None, None
+    with _GAMMA_CACHE_LOCK:
+        if len(_GAMMA_CACHE) >= _GAMMA_CACHE_MAX_ENTRIES:
+            _GAMMA_CACHE.pop(next(iter(_GAMMA_CACHE)), None)
+        _GAMMA_CACHE[market_id] = (now + _GAMMA_CACHE_TTL_SECONDS, tokens)
+    return tokens
+
+
+_CFG_INDEX_LOCK = threading.Lock()
+_CFG_INDEX_CACHE: Optional[Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]] = None
+
+
+def _config_by_polymarket() -> Dict[str, Dict[str, Any]]:
+    # get_all_markets() hands back the same mapping until it is replaced; holding a reference to it
+    # (rather than its id) keeps a recycled id from matching a stale index.
+    global _CFG_INDEX_CACHE
+    markets = get_all_markets()
+    cached = _CFG_INDEX_CACHE
+    if cached is not None and cached[0] is markets:
+        return cached[1]
+    index = {
+        str(market["polymarket_id"]): market
+        for market in markets.values()
+        if market.get("polymarket_id")
+    }
+    with _CFG_INDEX_LOCK:
+        _CFG_INDEX_CACHE = (markets, index)
+    return index
 
 
 class TradingContextResolver:
     def __init__(self):
+        self._gamma_session = requests.Session()
         self._dome = None
         try:
             self._dome = DomeClient()
@@ -430,20 +547,36 @@ class TradingContextResolver:
         result = self._dome.search_markets(query, limit=limit)
         found = result.get("markets_found") or []
 
-        config_by_polymarket = {}
-        for market in get_all_markets().values():
-            pid = market.get("polymarket_id")
-            if pid:
-                config_by_polymarket[str(pid)] = market
+        config_by_polymarket = _config_by_polymarket()
 
-        rows: List[Dict[str, Any]] = []
+        prepared = []
+        gamma_ids: Dict[str, None] = {}
         for market in found:
             market_id = str(market.get("market_id") or "")
-            question = str(market.get("question") or market.get("title") or "").strip()
             yes_token, no_token = _extract_token_ids_from_market(market)
+            if (not yes_token or not no_token) and market_id:
+                gamma_ids[market_id] = None
+            prepared.append((market, market_id, yes_token, no_token))
+
+        # Gamma lookups are independent round-trips; issue them together over one keep-alive session.
+        gamma_tokens: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        if gamma_ids:
+            gamma_tokens = dict(
+                zip(
+                    gamma_ids,
+                    _GAMMA_POOL.map(
+                        lambda mid: _extract_token_ids_from_gamma(mid, self._gamma_session),
+                        gamma_ids,
+                    ),
+                )
+            )
+
+        rows: List[Dict[str, Any]] = []
+        for market, market_id, yes_token, no_token in prepared:
+            question = str(market.get("question") or market.get("title") or "").strip()
 
             if (not yes_token or not no_token) and market_id:
-                gy, gn = _extract_token_ids_from_gamma(market_id)
+                gy, gn = gamma_tokens[market_id]
                 yes_token = yes_token or gy
                 no_token = no_token or gn
 
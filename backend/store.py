@@ -1,29 +1,59 @@
 from __future__ import annotations
 
+import logging
 import secrets
 import threading
 import time
-from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from .config import NONCE_TTL_SECONDS, SESSION_TTL_SECONDS
+import orjson
+
+from .config import MAX_IDEMPOTENCY_KEYS, NONCE_TTL_SECONDS, SESSION_TTL_SECONDS
+from .utils import address_bytes
+
+
+logger = logging.getLogger(__name__)
+
+_RATE_LIMIT_SWEEP_EVERY = 1024
+_NONCE_BYTES = 16
+_NONCE_BATCH = 64
+_EXPIRY_SWEEP_SECONDS = max(1.0, min(NONCE_TTL_SECONDS, SESSION_TTL_SECONDS) / 4)
 
 
 class InMemoryStore:
     def __init__(self):
-        self._lock = threading.RLock()
+        # One plain lock per namespace so unrelated operations never serialize on each other.
+        self._nonce_lock = threading.Lock()
+        self._rate_lock = threading.Lock()
+        self._tp_lock = threading.Lock()
+        self._idem_lock = threading.Lock()
 
         self._nonces: Dict[str, Dict[str, Any]] = {}
+        self._nonce_pool: List[str] = []
         self._sessions: Dict[str, Dict[str, Any]] = {}
-        self._rate_limits: Dict[str, List[float]] = defaultdict(list)
+        self._rate_limits: Dict[str, Tuple[float, float]] = {}
+        self._rate_limit_checks = 0
 
         self._tp_arms: Dict[str, Dict[str, Any]] = {}
-        self._idempotency_keys: set[str] = set()
+        # Lowercased EOA -> arm ids, as an insertion-ordered dict so listings keep creation order.
+        self._tp_arm_ids_by_eoa: Dict[str, Dict[str, None]] = {}
+        self._idempotency_keys: OrderedDict[str, None] = OrderedDict()
+
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_stop = threading.Event()
 
     def create_nonce(self, address: str, message: str) -> Dict[str, Any]:
-        nonce = secrets.token_hex(16)
         now = time.time()
-        with self._lock:
+        with self._nonce_lock:
+            # Nonces are handed to the client anyway, so draw them from the OS RNG in batches.
+            # Session tokens are credentials and are still generated one at a time.
+            if not self._nonce_pool:
+                raw = secrets.token_bytes(_NONCE_BYTES * _NONCE_BATCH)
+                self._nonce_pool = [
+                    raw[i : i + _NONCE_BYTES].hex() for i in range(0, len(raw), _NONCE_BYTES)
+                ]
+            nonce = self._nonce_pool.pop()
             self._nonces[address.lower()] = {
                 "nonce": nonce,
                 "message": message,
@@ -34,7 +64,7 @@ class InMemoryStore:
 
     def consume_nonce(self, address: str, nonce: str) -> Optional[Dict[str, Any]]:
         key = address.lower()
-        with self._lock:
+        with self._nonce_lock:
             record = self._nonces.get(key)
             if not record:
                 return None
@@ -57,86 +87,156 @@ class InMemoryStore:
         session = {
             "token": token,
             "eoa_address": eoa_address,
+            "eoa_address_bytes": address_bytes(eoa_address),
             "clob_creds": clob_creds,
             "trading_context": trading_context,
+            "trading_address_bytes": address_bytes(trading_context.get("trading_address")),
             "created_at": now,
             "expires_at": now + SESSION_TTL_SECONDS,
+            # /api/me body; neither field changes for the lifetime of the session.
+            "me_json": orjson.dumps({"eoa_address": eoa_address, "trading_context": trading_context}),
         }
-        with self._lock:
-            self._sessions[token] = session
+        self._sessions[token] = session
         return session
 
     def get_session(self, token: str) -> Optional[Dict[str, Any]]:
         if not token:
             return None
 
-        with self._lock:
-            session = self._sessions.get(token)
-            if not session:
-                return None
-            if session["expires_at"] < time.time():
-                self._sessions.pop(token, None)
-                return None
-            return session
+        # Single dict get/set/pop calls are atomic under the GIL; sessions need no lock.
+        session = self._sessions.get(token)
+        if not session:
+            return None
+        if session["expires_at"] < time.time():
+            self._sessions.pop(token, None)
+            return None
+        return session
 
     def delete_session(self, token: str) -> None:
-        with self._lock:
-            self._sessions.pop(token, None)
+        self._sessions.pop(token, None)
 
     def allow_rate_limit(self, key: str, max_requests: int, window_seconds: int) -> bool:
-        now = time.time()
-        floor = now - window_seconds
-        with self._lock:
-            entries = [ts for ts in self._rate_limits.get(key, []) if ts >= floor]
-            if len(entries) >= max_requests:
-                self._rate_limits[key] = entries
-                return False
-            entries.append(now)
-            self._rate_limits[key] = entries
-            return True
+        with self._rate_lock:
+            return self._allow_rate_limit_locked(key, max_requests, window_seconds)
+
+    def _allow_rate_limit_locked(self, key: str, max_requests: int, window_seconds: int) -> bool:
+        # Token bucket: holds up to max_requests tokens, refilled at max_requests per window.
+        now = time.monotonic()
+        capacity = float(max_requests)
+        refill_per_second = capacity / window_seconds if window_seconds > 0 else capacity
+        self._rate_limit_checks += 1
+        if self._rate_limit_checks % _RATE_LIMIT_SWEEP_EVERY == 0:
+            self._sweep_rate_limits_locked(now, window_seconds)
+        tokens, last_refill = self._rate_limits.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - last_refill) * refill_per_second)
+        if tokens < 1.0:
+            self._rate_limits[key] = (tokens, now)
+            return False
+        self._rate_limits[key] = (tokens - 1.0, now)
+        return True
+
+    def _sweep_rate_limits_locked(self, now: float, window_seconds: int) -> None:
+        # A bucket idle for a full window has refilled to capacity, which is the same as no entry.
+        idle_before = now - window_seconds
+        stale = [key for key, (_, last_refill) in self._rate_limits.items() if last_refill <= idle_before]
+        for key in stale:
+            del self._rate_limits[key]
 
     def save_tp_arm(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        with self._lock:
-            self._tp_arms[state["arm_id"]] = state
+        arm_id = state["arm_id"]
+        with self._tp_lock:
+            previous = self._tp_arms.get(arm_id)
+            if previous is not None:
+                self._unindex_tp_arm_locked(arm_id, previous)
+            self._tp_arms[arm_id] = state
+            self._index_tp_arm_locked(arm_id, state)
         return state
 
+    def _index_tp_arm_locked(self, arm_id: str, arm: Dict[str, Any]) -> None:
+        eoa = (arm.get("eoa_address") or "").lower()
+        self._tp_arm_ids_by_eoa.setdefault(eoa, {})[arm_id] = None
+
+    def _unindex_tp_arm_locked(self, arm_id: str, arm: Dict[str, Any]) -> None:
+        eoa = (arm.get("eoa_address") or "").lower()
+        arm_ids = self._tp_arm_ids_by_eoa.get(eoa)
+        if arm_ids is not None:
+            arm_ids.pop(arm_id, None)
+            if not arm_ids:
+                del self._tp_arm_ids_by_eoa[eoa]
+
     def get_tp_arm(self, arm_id: str) -> Optional[Dict[str, Any]]:
-        with self._lock:
+        with self._tp_lock:
             arm = self._tp_arms.get(arm_id)
             if arm is None:
                 return None
             return dict(arm)
 
-    def update_tp_arm(self, arm_id: str, patch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        with self._lock:
+    def update_tp_arm(
+        self,
+        arm_id: str,
+        patch: Dict[str, Any],
+        events: Sequence[Dict[str, Any]] = (),
+    ) -> Optional[Dict[str, Any]]:
+        with self._tp_lock:
             arm = self._tp_arms.get(arm_id)
             if arm is None:
                 return None
-            arm.update(patch)
-            self._tp_arms[arm_id] = arm
+            if "eoa_address" in patch:
+                self._unindex_tp_arm_locked(arm_id, arm)
+                arm.update(patch)
+                self._index_tp_arm_locked(arm_id, arm)
+            else:
+                arm.update(patch)
+            if events:
+                arm.setdefault("events", []).extend(events)
             return dict(arm)
 
-    def append_tp_event(self, arm_id: str, event: Dict[str, Any]) -> None:
-        with self._lock:
-            arm = self._tp_arms.get(arm_id)
-            if arm is None:
-                return
-            events = arm.setdefault("events", [])
-            events.append(event)
-            self._tp_arms[arm_id] = arm
-
     def get_tp_arms_for_user(self, eoa_address: str) -> List[Dict[str, Any]]:
         target = (eoa_address or "").lower()
-        with self._lock:
+        with self._tp_lock:
             return [
-                dict(arm)
-                for arm in self._tp_arms.values()
-                if (arm.get("eoa_address") or "").lower() == target
+                dict(self._tp_arms[arm_id])
+                for arm_id in self._tp_arm_ids_by_eoa.get(target, ())
             ]
 
     def mark_idempotent(self, key: str) -> bool:
-        with self._lock:
+        # LRU-bounded: a key is only forgotten after MAX_IDEMPOTENCY_KEYS newer ones.
+        with self._idem_lock:
             if key in self._idempotency_keys:
+                self._idempotency_keys.move_to_end(key)
                 return False
-            self._idempotency_keys.add(key)
+            self._idempotency_keys[key] = None
+            if len(self._idempotency_keys) > MAX_IDEMPOTENCY_KEYS:
+                self._idempotency_keys.popitem(last=False)
             return True
+
+    def sweep_expired(self) -> None:
+        # Lookups still check expiry; this only releases records nobody comes back for.
+        now = time.time()
+        with self._nonce_lock:
+            expired = [key for key, record in self._nonces.items() if record["expires_at"] < now]
+            for key in expired:
+                del self._nonces[key]
+        for token, session in self._sessions.copy().items():
+            if session["expires_at"] < now:
+                self._sessions.pop(token, None)
+
+    def start_sweeper(self) -> None:
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._sweeper_stop.clear()
+        self._sweeper = threading.Thread(target=self._sweep_forever, name="store-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        self._sweeper_stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+
+    def _sweep_forever(self) -> None:
+        while not self._sweeper_stop.wait(_EXPIRY_SWEEP_SECONDS):
+            try:
+                self.sweep_expired()
+            except Exception:
+                logger.exception("Store expiry sweep failed")
@@ -1,13 +1,31 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import heapq
+import logging
+import secrets
 import time
-import uuid
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Tuple
 
 from .clob_session import Level2SessionClobClient
-from .config import TP_MAX_MINUTES, TP_POLL_SECONDS
+from .config import TP_MAX_ACTIVE_ARMS, TP_MAX_MINUTES, TP_POLL_SECONDS
 from .store import InMemoryStore
+from .utils import NO_KEY, child_entries
+
+logger = logging.getLogger(__name__)
+
+# Poll delay starts here after any fill change or placement and doubles while the entry order is idle.
+_MIN_POLL_SECONDS = 0.25
+_MAX_POLL_FACTOR = 4
+# Clients are shared by arms with the same EOA, funder and API creds; least recently used go first.
+_MAX_CACHED_CLIENTS = 256
+# Arms on the same entry order and client share get_order responses this fresh. Kept under the
+# minimum poll delay so an arm never re-reads its own previous response.
+_ORDER_CACHE_SECONDS = min(TP_POLL_SECONDS / 2, _MIN_POLL_SECONDS)
+_ORDER_CACHE_SWEEP_EVERY = 256
 
 
 def _as_float(value: Any) -> Optional[float]:
@@ -26,105 +44,191 @@ def _as_float(value: Any) -> Optional[float]:
     return None
 
 
-def _collect_numeric_values(obj: Any, keys: List[str], out: List[float]) -> None:
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if str(k).lower() in keys:
-                val = _as_float(v)
-                if val is not None:
-                    out.append(val)
-            _collect_numeric_values(v, keys, out)
-    elif isinstance(obj, list):
-        for item in obj:
-            _collect_numeric_values(item, keys, out)
-
-
-def _collect_status(obj: Any) -> Optional[str]:
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if str(k).lower() in {"status", "state", "order_status"} and isinstance(v, str):
-                return v.lower()
-            nested = _collect_status(v)
-            if nested:
-                return nested
-    elif isinstance(obj, list):
-        for item in obj:
-            nested = _collect_status(item)
-            if nested:
-                return nested
-    return None
+_STATUS_KEYS = frozenset({"status", "state", "order_status"})
+_PCT_KEYS = frozenset(
+    {
+        "filledpct",
+        "filled_pct",
+        "fill_pct",
+        "filledpercentage",
+        "completion",
+    }
+)
+_AMOUNT_KEYS = frozenset(
+    {
+        "filled",
+        "filledsize",
+        "filled_size",
+        "sizematched",
+        "size_matched",
+        "matchedsize",
+        "matched_size",
+        "filledamount",
+        "filled_amount",
+        "executedsize",
+        "executed_size",
+    }
+)
+
+_MAX_SCAN_DEPTH = 8
+_MAX_SCAN_NODES = 10_000
+
+
+# One depth-first pass (a stack of container iterators, in document order) gathers the first
+# non-empty status plus the pct and amount candidates, instead of three separate walks. It is
+# bounded in depth and nodes against pathological payloads, and stops as soon as the result
+# is decided: a filled status, or a usable pct once the status is known or not needed.
+def _scan_fill_fields(
+    obj: Any,
+    need_status: bool = True,
+    max_depth: int = _MAX_SCAN_DEPTH,
+    max_nodes: int = _MAX_SCAN_NODES,
+) -> Tuple[Optional[str], List[float], List[float]]:
+    status: Optional[str] = None
+    pct_values: List[float] = []
+    amount_values: List[float] = []
+    if not isinstance(obj, (dict, list)):
+        return status, pct_values, amount_values
+
+    pct_append = pct_values.append
+    amount_append = amount_values.append
+    pct_found = False
+    nodes = 0
+    stack = [child_entries(obj)]
+    while stack:
+        for key, value in stack[-1]:
+            nodes += 1
+            if nodes > max_nodes:
+                return status, pct_values, amount_values
+            if key is not NO_KEY:
+                # CLOB payload keys are normally already lowercase, which needs no str()/lower() copy.
+                name = key if type(key) is str and key.islower() else str(key).lower()
+                if name in _PCT_KEYS:
+                    val = _as_float(value)
+                    if val is not None:
+                        pct_append(val)
+                        if 0 <= val <= 100:
+                            pct_found = True
+                            if status is not None or not need_status:
+                                return status, pct_values, amount_values
+                elif name in _AMOUNT_KEYS:
+                    val = _as_float(value)
+                    if val is not None:
+                        amount_append(val)
+                elif need_status and status is None and name in _STATUS_KEYS and isinstance(value, str) and value:
+                    status = value.lower()
+                    if pct_found or _is_filled_status(status):
+                        return status, pct_values, amount_values
+            if isinstance(value, (dict, list)) and len(stack) < max_depth:
+                stack.append(child_entries(value))
+                break
+        else:
+            stack.pop()
+    return status, pct_values, amount_values
+
+
+def _is_filled_status(status_text: Optional[str]) -> bool:
+    return bool(status_text) and "filled" in status_text and "partial" not in status_text
 
 
 def extract_filled_tokens(order_payload: Dict[str, Any], entry_size_tokens: float) -> float:
-    status_text = _collect_status(order_payload)
-    if status_text and "filled" in status_text and "partial" not in status_text:
+    # The CLOB reports status on the order itself; a definitive fill there needs no walk at all.
+    top_status = order_payload.get("status") if isinstance(order_payload, dict) else None
+    if not isinstance(top_status, str) or not top_status:
+        top_status = None
+    elif _is_filled_status(top_status.lower()):
         return entry_size_tokens
 
-    pct_values: List[float] = []
-    _collect_numeric_values(
-        order_payload,
-        [
-            "filledpct",
-            "filled_pct",
-            "fill_pct",
-            "filledpercentage",
-            "completion",
-        ],
-        pct_values,
-    )
-
-    for pct in pct_values:
-        if 0 <= pct <= 1:
-            return max(0.0, min(entry_size_tokens, pct * entry_size_tokens))
-        if 1 < pct <= 100:
-            return max(0.0, min(entry_size_tokens, (pct / 100.0) * entry_size_tokens))
+    status_text, pct_values, amount_values = _scan_fill_fields(order_payload, need_status=top_status is None)
+    if top_status is None and _is_filled_status(status_text):
+        return entry_size_tokens
 
-    amount_values: List[float] = []
-    _collect_numeric_values(
-        order_payload,
-        [
-            "filled",
-            "filledsize",
-            "filled_size",
-            "sizematched",
-            "size_matched",
-            "matchedsize",
-            "matched_size",
-            "filledamount",
-            "filled_amount",
-            "executedsize",
-            "executed_size",
-        ],
-        amount_values,
-    )
-
-    best = 0.0
-    for value in amount_values:
-        val = value
-        if val > entry_size_tokens * 1000:
-            val = val / 1e6
-        if val > best:
-            best = val
-
-    return max(0.0, min(entry_size_tokens, best))
+    pct = next((value for value in pct_values if 0 <= value <= 100), None)
+    if pct is not None:
+        filled = pct * entry_size_tokens if pct <= 1 else (pct / 100.0) * entry_size_tokens
+    else:
+        # Amounts above 1000x the entry size are raw 6-decimal units; non-positive (and NaN) never win.
+        raw_units_above = entry_size_tokens * 1000
+        filled = max(
+            (value / 1e6 if value > raw_units_above else value for value in amount_values if value > 0),
+            default=0.0,
+        )
+
+    # filled can't be NaN here, so this ladder clamps exactly like max(0.0, min(entry, filled)).
+    if filled >= entry_size_tokens:
+        return entry_size_tokens
+    return filled if filled > 0 else 0.0
+
+
+class TpCapacityExceeded(Exception):
+    pass
+
+
+class _ArmPoller:
+    # Per-arm monitor state that outlives a single poll. This is the only writer of placed_levels,
+    # so membership is tracked here and the stored dict is only rebuilt on ticks that add an entry.
+    def __init__(self, arm_id: str, arm: Dict[str, Any]):
+        self.arm_id = arm_id
+        self.client: Optional[Level2SessionClobClient] = None
+        self.entry_order_id = arm["entry_order_id"]
+        self.entry_size = float(arm["entry_size_tokens"])
+        self.deadline = float(arm["created_at"]) + int(arm["max_minutes"]) * 60
+
+        poll_seconds = float(arm.get("poll_seconds") or TP_POLL_SECONDS)
+        self.min_delay = min(_MIN_POLL_SECONDS, poll_seconds)
+        self.max_delay = poll_seconds * _MAX_POLL_FACTOR
+        self.delay = self.min_delay
+        self.last_filled: Optional[float] = None
+
+        self.thresholds = arm["level_thresholds"]
+        self.level_count = len(self.thresholds)
+        self.level_keys = [str(idx) for idx in range(self.level_count)]
+        self.placed = {int(key) for key in arm.get("placed_levels") or {}}
+        self.signed_orders = arm.get("signed_tp_orders") or []
+        # Built once: a level whose post failed is re-checked against its key on every later tick.
+        self.idem_keys = [
+            f"{arm_id}:{idx}:{signed_cfg['signature']}" if signed_cfg else ""
+            for idx, signed_cfg in enumerate(self.signed_orders)
+        ]
 
 
 class TpEngine:
+    # One dispatcher coroutine sleeps until the earliest arm is due (a heap of deadlines) and starts
+    # a short-lived task per due poll, rather than every arm keeping its own sleeping coroutine.
     def __init__(self, store: InMemoryStore):
         self.store = store
-        self._tasks: Dict[str, asyncio.Task] = {}
+        self._pollers: Dict[str, _ArmPoller] = {}
+        self._polling: Dict[str, asyncio.Task] = {}
+        # (due, arm_id); each active arm has exactly one entry, pushed after its previous poll.
+        self._schedule: List[Tuple[float, str]] = []
+        self._schedule_changed: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._clients: OrderedDict[Tuple[Any, ...], Level2SessionClobClient] = OrderedDict()
+        self._order_cache: Dict[Tuple[Level2SessionClobClient, str], Tuple[float, Dict[str, Any]]] = {}
+        self._order_fetches: Dict[Tuple[Level2SessionClobClient, str], asyncio.Future] = {}
+        self._order_fetch_count = 0
 
     def arm(self, session: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-        arm_id = f"tp_{uuid.uuid4().hex[:12]}"
+        if len(self._pollers) >= TP_MAX_ACTIVE_ARMS:
+            raise TpCapacityExceeded()
+
+        arm_id = f"tp_{secrets.token_hex(6)}"
         now = time.time()
 
-        by_level = {
-            int(item["level_index"]): {
-                "order_type": item.get("order_type", "GTC"),
-                "signed_order": item["signed_order"],
-            }
-            for item in payload["signed_tp_orders"]
-        }
+        levels = [level.model_dump() if hasattr(level, "model_dump") else dict(level) for level in payload["levels"]]
+        size_pcts = tuple(float(level.get("size_pct", 0.0)) for level in levels)
+
+        # Indexed by level position, so the stored state round-trips through JSON unchanged
+        # (int dict keys would come back as strings) and lookups need no key at all.
+        by_level: List[Optional[Dict[str, Any]]] = [None] * len(levels)
+        for item in payload["signed_tp_orders"]:
+            level_index = int(item["level_index"])
+            if level_index < len(levels):
+                by_level[level_index] = {
+                    "order_type": item.get("order_type", "GTC"),
+                    "signed_order": item["signed_order"],
+                    "signature": str((item["signed_order"] or {}).get("signature") or ""),
+                }
 
         state = {
             "arm_id": arm_id,
@@ -135,7 +239,9 @@ class TpEngine:
             "token_id": payload["token_id"],
             "entry_size_tokens": float(payload["entry_size_tokens"]),
             "mode": payload["mode"],
-            "levels": [level.model_dump() if hasattr(level, "model_dump") else dict(level) for level in payload["levels"]],
+            "levels": levels,
+            # Cumulative fill fraction at which each level triggers; levels are placed in order.
+            "level_thresholds": tuple(accumulate(size_pct / 100.0 for size_pct in size_pcts)),
             "signed_tp_orders": by_level,
             "placed_levels": {},
             "status": "armed",
@@ -149,138 +255,257 @@ class TpEngine:
 
         self.store.save_tp_arm(state)
 
-        loop = asyncio.get_running_loop()
-        task = loop.create_task(self._monitor_arm(arm_id), name=f"tp-monitor-{arm_id}")
-        self._tasks[arm_id] = task
+        self._pollers[arm_id] = _ArmPoller(arm_id, self.store.get_tp_arm(arm_id))
+        self._ensure_dispatcher()
+        self._schedule_poll(arm_id, 0.0)
 
         return state
 
-    async def _monitor_arm(self, arm_id: str) -> None:
-        arm = self.store.get_tp_arm(arm_id)
-        if not arm:
+    def _ensure_dispatcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._dispatcher is not None and not self._dispatcher.done() and self._dispatcher.get_loop() is loop:
+            return
+        self._schedule_changed = asyncio.Event()
+        self._dispatcher = loop.create_task(self._dispatch(), name="tp-dispatcher")
+        self._dispatcher.add_done_callback(self._dispatcher_done)
+
+    def _dispatcher_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("TP dispatcher crashed", exc_info=task.exception())
+
+    def _schedule_poll(self, arm_id: str, delay: float) -> None:
+        heapq.heappush(self._schedule, (time.monotonic() + delay, arm_id))
+        if self._schedule_changed is not None:
+            self._schedule_changed.set()
+
+    def _drop_poller(self, arm_id: str) -> None:
+        self._pollers.pop(arm_id, None)
+        if self._schedule_changed is not None:
+            self._schedule_changed.set()
+
+    async def _dispatch(self) -> None:
+        changed = self._schedule_changed
+        schedule = self._schedule
+        while self._pollers:
+            now = time.monotonic()
+            while schedule and schedule[0][0] <= now:
+                _, arm_id = heapq.heappop(schedule)
+                poller = self._pollers.get(arm_id)
+                if poller is None:
+                    continue
+                task = asyncio.create_task(self._poll_arm(poller), name=f"tp-poll-{arm_id}")
+                self._polling[arm_id] = task
+                task.add_done_callback(lambda done, arm_id=arm_id: self._poll_done(arm_id, done))
+
+            changed.clear()
+            timeout = schedule[0][0] - now if schedule else None
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _poll_done(self, arm_id: str, task: asyncio.Task) -> None:
+        self._polling.pop(arm_id, None)
+        if arm_id not in self._pollers:
+            return
+        if task.cancelled():
+            self._drop_poller(arm_id)
+            return
+        exc = task.exception()
+        if exc is not None:
+            self._drop_poller(arm_id)
+            # Polls only exit by returning; anything else is a bug, so surface it on the arm too.
+            logger.error("TP monitor for %s crashed", arm_id, exc_info=exc)
+            now = time.time()
+            self.store.update_tp_arm(
+                arm_id,
+                {"status": "error", "updated_at": now},
+                events=[{"ts": now, "event": "monitor_error", "error": str(exc)}],
+            )
             return
 
+        delay = task.result()
+        if delay is None:
+            self._drop_poller(arm_id)
+            return
+        self._schedule_poll(arm_id, delay)
+
+    def _client_for_arm(self, arm: Dict[str, Any]) -> Level2SessionClobClient:
         ctx = arm["trading_context"]
+        creds = arm["clob_creds"]
+        funder_address = ctx.get("funder_address")
+        signature_type = int(ctx.get("signature_type") or 0)
+        key = (
+            arm["eoa_address"],
+            funder_address,
+            signature_type,
+            creds["api_key"],
+            creds["api_secret"],
+            creds["api_passphrase"],
+        )
+        client = self._clients.get(key)
+        if client is not None:
+            self._clients.move_to_end(key)
+            return client
+
         client = Level2SessionClobClient(
             eoa_address=arm["eoa_address"],
-            creds=arm["clob_creds"],
-            funder_address=ctx.get("funder_address"),
-            signature_type=int(ctx.get("signature_type") or 0),
+            creds=creds,
+            funder_address=funder_address,
+            signature_type=signature_type,
         )
+        self._clients[key] = client
+        if len(self._clients) > _MAX_CACHED_CLIENTS:
+            self._clients.popitem(last=False)
+        return client
+
+    async def _get_order(self, client: Level2SessionClobClient, order_id: str) -> Dict[str, Any]:
+        key = (client, order_id)
+        cached = self._order_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _ORDER_CACHE_SECONDS:
+            return cached[1]
+
+        # Single flight: concurrent callers await the one request already on its way.
+        fetch = self._order_fetches.get(key)
+        if fetch is None:
+            # The CLOB client is sync; run it off the loop so other arms and requests keep going.
+            fetch = asyncio.ensure_future(asyncio.to_thread(client.get_order, order_id))
+            self._order_fetches[key] = fetch
+            fetch.add_done_callback(lambda done: self._order_fetched(key, done))
+        return await asyncio.shield(fetch)
+
+    def _order_fetched(self, key: Tuple[Level2SessionClobClient, str], fetch: asyncio.Future) -> None:
+        self._order_fetches.pop(key, None)
+        if fetch.cancelled() or fetch.exception() is not None:
+            return
+        now = time.monotonic()
+        self._order_fetch_count += 1
+        if self._order_fetch_count % _ORDER_CACHE_SWEEP_EVERY == 0:
+            stale_before = now - _ORDER_CACHE_SECONDS
+            for stale in [k for k, (fetched_at, _) in self._order_cache.items() if fetched_at < stale_before]:
+                del self._order_cache[stale]
+        self._order_cache[key] = (now, fetch.result())
+
+    async def _poll_arm(self, poller: _ArmPoller) -> Optional[float]:
+        # One tick for one arm; returns the delay until its next tick, or None once it is finished.
+        arm_id = poller.arm_id
+        arm = self.store.get_tp_arm(arm_id)
+        if arm is None:
+            return None
+        now = time.time()
+        if now >= poller.deadline:
+            self.store.update_tp_arm(
+                arm_id,
+                {
+                    "status": "timeout",
+                    "updated_at": now,
+                },
+                events=[{"ts": now, "event": "timeout", "message": "TP arm timed out"}],
+            )
+            return None
 
-        created_at = float(arm["created_at"])
-        deadline = created_at + int(arm["max_minutes"]) * 60
-
-        while True:
-            now = time.time()
-            if now >= deadline:
-                self.store.update_tp_arm(
-                    arm_id,
-                    {
-                        "status": "timeout",
-                        "updated_at": now,
-                    },
-                )
-                self.store.append_tp_event(
-                    arm_id,
-                    {"ts": now, "event": "timeout", "message": "TP arm timed out"},
-                )
-                break
-
-            arm = self.store.get_tp_arm(arm_id)
-            if not arm:
-                break
-            if arm.get("status") in {"completed", "cancelled", "error", "timeout"}:
-                break
-
-            try:
-                order_resp = client.get_order(arm["entry_order_id"])
-                order_payload = order_resp.get("order") or {}
-                filled_tokens = extract_filled_tokens(order_payload, float(arm["entry_size_tokens"]))
-
-                self.store.update_tp_arm(
-                    arm_id,
-                    {
-                        "last_filled_tokens": filled_tokens,
-                        "updated_at": now,
-                    },
-                )
+        if arm.get("status") in {"completed", "cancelled", "error", "timeout"}:
+            return None
 
-                fill_ratio = 0.0
-                entry_size = float(arm["entry_size_tokens"])
-                if entry_size > 0:
-                    fill_ratio = max(0.0, min(1.0, filled_tokens / entry_size))
-
-                cumulative = 0.0
-                placed_levels = dict(arm.get("placed_levels") or {})
-
-                for idx, level in enumerate(arm.get("levels") or []):
-                    cumulative += float(level.get("size_pct", 0.0)) / 100.0
-                    if fill_ratio + 1e-9 < cumulative:
-                        continue
-                    if str(idx) in placed_levels:
-                        continue
-
-                    signed_cfg = (arm.get("signed_tp_orders") or {}).get(idx)
-                    if not signed_cfg:
-                        placed_levels[str(idx)] = {
-                            "status": "error",
-                            "error": "Missing signed TP order for level",
-                            "ts": now,
-                        }
-                        continue
-
-                    sig = str((signed_cfg.get("signed_order") or {}).get("signature") or "")
-                    idem = f"{arm_id}:{idx}:{sig}"
-                    if not self.store.mark_idempotent(idem):
-                        continue
-
-                    post = client.post_signed_order(
+        if poller.client is None:
+            poller.client = self._client_for_arm(arm)
+        client = poller.client
+        entry_size = poller.entry_size
+        placed = poller.placed
+        signed_orders = poller.signed_orders
+        level_keys = poller.level_keys
+        level_count = poller.level_count
+
+        # Everything a tick learns goes to the store in one update_tp_arm call at the end.
+        changed = False
+        done = False
+        updates: Dict[str, Any] = {"updated_at": now}
+        events: List[Dict[str, Any]] = []
+        try:
+            order_resp = await self._get_order(client, poller.entry_order_id)
+            order_payload = order_resp.get("order") or {}
+            filled_tokens = extract_filled_tokens(order_payload, entry_size)
+            changed = filled_tokens != poller.last_filled
+            poller.last_filled = filled_tokens
+            updates["last_filled_tokens"] = filled_tokens
+
+            fill_ratio = 0.0
+            if entry_size > 0:
+                fill_ratio = max(0.0, min(1.0, filled_tokens / entry_size))
+
+            eligible = bisect.bisect_right(poller.thresholds, fill_ratio + 1e-9)
+            new_levels: Dict[str, Any] = {}
+            ready: List[Tuple[int, Dict[str, Any]]] = []
+
+            for idx in range(eligible):
+                if idx in placed:
+                    continue
+
+                signed_cfg = signed_orders[idx] if idx < len(signed_orders) else None
+                if not signed_cfg:
+                    new_levels[level_keys[idx]] = {
+                        "status": "error",
+                        "error": "Missing signed TP order for level",
+                        "ts": now,
+                    }
+                    continue
+
+                if not self.store.mark_idempotent(poller.idem_keys[idx]):
+                    continue
+                ready.append((idx, signed_cfg))
+
+            # Levels that became eligible on the same tick are posted concurrently; each is
+            # already marked idempotent, so a failed post is never retried by a later tick.
+            posts = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        client.post_signed_order,
                         signed_order=signed_cfg["signed_order"],
                         order_type=signed_cfg.get("order_type", "GTC"),
                     )
-
-                    placed_levels[str(idx)] = {
-                        "status": "placed",
-                        "tp_order_id": post.get("order_id"),
-                        "response": post.get("response"),
-                        "fill_ratio_trigger": round(fill_ratio, 6),
+                    for _, signed_cfg in ready
+                ),
+                return_exceptions=True,
+            )
+
+            for (idx, _), post in zip(ready, posts):
+                if isinstance(post, BaseException):
+                    events.append({"ts": now, "event": "poll_error", "level": idx, "error": str(post)})
+                    continue
+
+                changed = True
+                new_levels[level_keys[idx]] = {
+                    "status": "placed",
+                    "tp_order_id": post.get("order_id"),
+                    "response": post.get("response"),
+                    "fill_ratio_trigger": round(fill_ratio, 6),
+                    "ts": now,
+                }
+
+                events.append(
+                    {
                         "ts": now,
+                        "event": "tp_placed",
+                        "level": idx,
+                        "tp_order_id": post.get("order_id"),
+                        "fill_ratio": round(fill_ratio, 6),
                     }
-
-                    self.store.append_tp_event(
-                        arm_id,
-                        {
-                            "ts": now,
-                            "event": "tp_placed",
-                            "level": idx,
-                            "tp_order_id": post.get("order_id"),
-                            "fill_ratio": round(fill_ratio, 6),
-                        },
-                    )
-
-                done = len(placed_levels) >= len(arm.get("levels") or []) and len(arm.get("levels") or []) > 0
-                status = "completed" if done else "armed"
-
-                self.store.update_tp_arm(
-                    arm_id,
-                    {
-                        "placed_levels": placed_levels,
-                        "status": status,
-                        "updated_at": now,
-                    },
                 )
 
-                if done:
-                    break
+            if new_levels:
+                updates["placed_levels"] = {**(arm.get("placed_levels") or {}), **new_levels}
+                placed.update(int(key) for key in new_levels)
+            done = len(placed) >= level_count and level_count > 0
+            updates["status"] = "completed" if done else "armed"
 
-            except Exception as exc:
-                self.store.append_tp_event(
-                    arm_id,
-                    {"ts": now, "event": "poll_error", "error": str(exc)},
-                )
+        except Exception as exc:
+            events.append({"ts": now, "event": "poll_error", "error": str(exc)})
+
+        if self.store.update_tp_arm(arm_id, updates, events=events) is None or done:
+            return None
 
-            await asyncio.sleep(float(arm.get("poll_seconds") or TP_POLL_SECONDS))
+        poller.delay = poller.min_delay if changed else min(poller.delay * 2, poller.max_delay)
+        return poller.delay
 
     def get_status(self, eoa_address: str, arm_id: Optional[str] = None) -> List[Dict[str, Any]]:
         if arm_id:
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from itertools import repeat
+from typing import Any, Iterator, Optional, Tuple
+
+import orjson
+import requests
+
+
+def parse_json(response: requests.Response) -> Any:
+    # Only for payloads without unquoted big integers; orjson turns those into floats.
+    return orjson.loads(response.content)
+
+
+def address_bytes(address: Any) -> Optional[bytes]:
+    # 20-byte form for case-insensitive address equality; None for anything malformed.
+    text = str(address or "")
+    if text[:2] in ("0x", "0X"):
+        text = text[2:]
+    if len(text) != 40:
+        return None
+    try:
+        return bytes.fromhex(text)
+    except ValueError:
+        return None
+
+
+NO_KEY = object()
+
+
+def child_entries(value: Any) -> Iterator[Tuple[Any, Any]]:
+    # (key, value) pairs of a dict or list; list items carry NO_KEY.
+    if isinstance(value, dict):
+        return iter(value.items())
+    return zip(repeat(NO_KEY), value)
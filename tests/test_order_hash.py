@@ -0,0 +1,80 @@
+import os
+
+os.environ.setdefault("WEB_EXPERIMENT", "1")
+
+import pytest
+from eth_account.messages import encode_typed_data
+from eth_utils import keccak
+
+from backend import main
+from backend.models import ParsedSignedOrder
+
+_ORDER_FIELDS = [
+    ("salt", "uint256"),
+    ("maker", "address"),
+    ("signer", "address"),
+    ("taker", "address"),
+    ("tokenId", "uint256"),
+    ("makerAmount", "uint256"),
+    ("takerAmount", "uint256"),
+    ("expiration", "uint256"),
+    ("nonce", "uint256"),
+    ("feeRateBps", "uint256"),
+    ("side", "uint8"),
+    ("signatureType", "uint8"),
+]
+
+_TOKEN_ID = 77680902575693269510705775150133261883431641996305813878639196300490247886068
+
+
+def _typed_data(order: ParsedSignedOrder, exchange: str) -> dict:
+    message = {name: getattr(order, name) for name, _ in _ORDER_FIELDS}
+    message["side"] = 0 if order.side == "BUY" else 1
+    return {
+        "types": {
+            "EIP712Domain": [
+                {"name": "name", "type": "string"},
+                {"name": "version", "type": "string"},
+                {"name": "chainId", "type": "uint256"},
+                {"name": "verifyingContract", "type": "address"},
+            ],
+            "Order": [{"name": name, "type": type_} for name, type_ in _ORDER_FIELDS],
+        },
+        "primaryType": "Order",
+        "domain": {
+            "name": "Polymarket CTF Exchange",
+            "version": "1",
+            "chainId": main.CHAIN_ID,
+            "verifyingContract": exchange,
+        },
+        "message": message,
+    }
+
+
+@pytest.mark.parametrize("exchange", [main.REGULAR_EXCHANGE, main.NEG_RISK_EXCHANGE])
+@pytest.mark.parametrize("side", ["BUY", "SELL"])
+def test_order_digest_matches_eth_account(exchange: str, side: str) -> None:
+    order = ParsedSignedOrder(
+        salt="123456789",
+        maker="0x4a55FCB7219A0958bb8e4b79eD64985fd5847376",
+        signer="0x4a55fcb7219a0958bb8e4b79ed64985fd5847376",
+        taker="0x0000000000000000000000000000000000000000",
+        tokenId=str(_TOKEN_ID),
+        makerAmount=str(2**63 + 7),
+        takerAmount="2000000",
+        expiration="0",
+        nonce=str(2**200),
+        feeRateBps="0",
+        side=side,
+        signatureType="1",
+        signature="0x",
+    )
+    expected = encode_typed_data(full_message=_typed_data(order, exchange))
+
+    struct_hash = main._order_struct_hash(order)
+
+    assert struct_hash == expected.body
+    assert main._order_domain_separator(exchange) == expected.header
+    assert main._order_digest(struct_hash, exchange) == keccak(
+        b"\x19" + expected.version + expected.header + expected.body
+    )